@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+ST Rules Shared Patterns
+
+This module holds the compiled regular expressions and constant lookup tables
+that more than one ST rule needs. They are built once at import time and shared
+by every rule module that imports them.
+
+Author: Lance
+License: Apache 2.0
+"""
+
+import re
+
+# Heredoc start marker (<<EOF, <<-EOF, etc.) at the end of a line
+HEREDOC_RE = re.compile(r'<<-?([A-Z]+)\s*$')
+
+# Nested block declaration line
+BLOCK_DECL_RE = re.compile(r'^\s*(data|resource|variable|output|locals|module)\s+')
+# Cheap prefix guard (on the stripped line) so that the declaration regex only runs on candidate lines
+BLOCK_DECL_KEYWORDS = ('data', 'resource', 'variable', 'output', 'locals', 'module')
+
+# Meta-parameters are checked by ST.008, so other rules may skip them
+META_PARAMETERS = frozenset({'count', 'for_each', 'provider', 'depends_on', 'lifecycle'})
+
+# Common Terraform functions that can wrap objects/arrays, as a tuple for str.startswith
+FUNCTION_PATTERNS = ('jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(',
+                     'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(')
@@ -67,7 +67,41 @@ License: Apache 2.0
 
 import re
 import sys
-from typing import Callable, List, Tuple, Optional, Dict
+from itertools import accumulate
+from typing import Callable, List, NamedTuple, Tuple, Optional, Dict, FrozenSet
+
+from ._common import HEREDOC_RE, BLOCK_DECL_RE, BLOCK_DECL_KEYWORDS, META_PARAMETERS, FUNCTION_PATTERNS
+
+# Block declaration header, compiled once at import time.
+# Each label may be double-quoted, single-quoted, or a bare identifier.
+# Groups: 'two' (data/resource) labels at 2-4 and 5-7, 'one' (provider/variable/output)
+# label at 9-11, 'bare' (locals/terraform) has no label.
+_BLOCK_LABEL = r'(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))'
+_BLOCK_HEADER_RE = re.compile(
+    r'(?P<two>data|resource)\s+' + _BLOCK_LABEL + r'\s+' + _BLOCK_LABEL + r'\s*\{'
+    r'|(?P<one>provider|variable|output)\s+' + _BLOCK_LABEL + r'\s*\{'
+    r'|(?P<bare>locals|terraform)\s*\{'
+)
+# Cheap prefix guard so that the header regex only runs on candidate lines
+_BLOCK_KEYWORDS = ('data', 'resource', 'provider', 'variable', 'output', 'locals', 'terraform')
+
+# A quoted string or a '#' outside of one. A quote preceded by a backslash neither opens nor
+# closes a string, and an unterminated string runs to the end of the line.
+_COMMENT_RE = re.compile(r'(?<!\\)(["\'])(?:(?!(?<!\\)\1).)*(?:(?<!\\)\1|$)|#')
+
+# Parameter whose value opens an object (e.g. a provider entry in required_providers)
+_OBJECT_PARAM_RE = re.compile(r'^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*\{')
+
+# Leading quoted or bare parameter name of a tfvars line
+_QUOTED_PARAM_NAME_RE = re.compile(r'^\s*(["\'])([^"\'=\s]+)\1')
+_BARE_PARAM_NAME_RE = re.compile(r'^\s*([^"\'=\s]+)')
+
+# Standalone brace and bracket lines (trailing comma stripped) that delimit tfvars sections
+_BOUNDARY_MARKERS = frozenset(('{', '}', '[', ']'))
+
+# Comparison operators (==, !=, >=, <=) next to a quote, i.e. quoted as a string value such as "=="
+_DOUBLE_QUOTED_COMPARISONS = ('"==', '"!=', '">=', '"<=', '=="', '!="', '>="', '<="')
+_SINGLE_QUOTED_COMPARISONS = ("'==", "'!=", "'>=", "'<=", "=='", "!='", ">='", "<='")
 
 
 def check_st003_parameter_alignment(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
@@ -106,91 +140,127 @@ def check_st003_parameter_alignment(file_path: str, content: str, log_error_func
         No exceptions are raised by this function. All errors are handled
         gracefully and reported through the logging mechanism.
     """
-    clean_content = _remove_comments_for_parsing(content)
-    
+    # Every check below is about '=' assignments, so a file without any has nothing to report
+    if '=' not in content:
+        return
+
     # Check if this is a terraform.tfvars file
     if file_path.endswith('.tfvars'):
+        clean_content = _remove_comments_for_parsing(content)
         _check_tfvars_parameter_alignment(file_path, clean_content, log_error_func)
     else:
-        blocks = _extract_code_blocks(clean_content)
+        clean_lines = _remove_comments_lines(content)
+        blocks = _extract_code_blocks(clean_lines)
         all_errors = []
 
         for block_type, start_line, block_lines in blocks:
-            sections = _split_into_code_sections(block_lines)
-            
-            
-            # Check alignment and spacing within each individual section
-            for section in sections:
-                errors = _check_parameter_alignment_in_section(section, block_type, start_line, block_lines)
-                all_errors.extend(errors)
+            all_errors.extend(_check_block_alignment(block_type, start_line, block_lines))
         
         # Sort errors by line number
         all_errors.sort(key=lambda x: x[0])
         
-        # Deduplicate errors (same line number and error message)
-        seen = set()
-        unique_errors = []
-        for line_num, error_msg in all_errors:
-            key = (line_num, error_msg)
-            if key not in seen:
-                seen.add(key)
-                unique_errors.append((line_num, error_msg))
+        # Deduplicate errors (same line number and error message), keeping the sorted order
+        unique_errors = list(dict.fromkeys(all_errors))
         
         # Report sorted and deduplicated errors
         for line_num, error_msg in unique_errors:
             log_error_func(file_path, "ST.003", error_msg, line_num)
 
 
-def _remove_comments_for_parsing(content: str) -> str:
+def _check_block_alignment(block_type: str, start_line: int, block_lines: List[str]) -> List[Tuple[int, str]]:
     """
-    Remove comments from content for parsing, but preserve line structure.
+    Check parameter alignment and spacing for a single code block.
+
+    Blocks are independent of each other, errors are merged and deduplicated by the caller.
+
+    Args:
+        block_type (str): Block identifier (e.g., 'resource.type.name')
+        start_line (int): Line number where the block starts
+        block_lines (List[str]): Lines of the block body
+
+    Returns:
+        List[Tuple[int, str]]: List of (line_number, error_message) tuples
+    """
+    errors = []
+
+    # Nothing to align in a block without any assignment (e.g. only nested blocks)
+    if not any('=' in line for line in block_lines):
+        return errors
+
+    # Per-line columns shared by the section splitting and the per-section checks
+    columns = _scan_block_lines(block_lines)
+
+    # Check alignment and spacing within each individual section
+    for section in _split_into_code_sections(block_lines, columns):
+        errors.extend(_check_parameter_alignment_in_section(section, block_type, start_line, block_lines, columns))
+
+    return errors
+
+
+def _remove_comments_lines(content: str) -> List[str]:
+    """
+    Remove comments from content for parsing, returning the cleaned lines.
 
     Args:
         content (str): The original file content
 
     Returns:
-        str: Content with comments removed
+        List[str]: The lines of the content with comments removed
     """
     lines = content.split('\n')
+    if '#' not in content:
+        return lines
+
     cleaned_lines = []
 
     for line in lines:
-        if '#' in line:
-            in_quotes = False
-            quote_char = None
-            for i, char in enumerate(line):
-                if char in ['"', "'"] and (i == 0 or line[i-1] != '\\'):
-                    if not in_quotes:
-                        in_quotes = True
-                        quote_char = char
-                    elif char == quote_char:
-                        in_quotes = False
-                        quote_char = None
-                elif char == '#' and not in_quotes:
-                    # If the line is only a comment (after stripping), keep the original line
-                    # to preserve line structure
-                    stripped_before_comment = line[:i].strip()
-                    if not stripped_before_comment:
-                        line = line  # Keep original line (comment line)
-                    else:
-                        line = line[:i].rstrip()  # Remove comment but keep content
-                    break
+        comment_start = line.find('#')
+        if comment_start >= 0:
+            # Without a quote before the first '#' it cannot be inside a string,
+            # otherwise walk the quoted strings to find the first '#' outside of them
+            if line.find('"', 0, comment_start) >= 0 or line.find("'", 0, comment_start) >= 0:
+                comment_start = -1
+                for match in _COMMENT_RE.finditer(line):
+                    if match.group(1) is None:
+                        comment_start = match.start()
+                        break
+            if comment_start >= 0:
+                before_comment = line[:comment_start]
+                # If the line is only a comment (after stripping), keep the original line
+                # to preserve line structure
+                if before_comment.strip():
+                    line = before_comment.rstrip()  # Remove comment but keep content
         cleaned_lines.append(line)
 
-    return '\n'.join(cleaned_lines)
+    return cleaned_lines
+
+
+def _remove_comments_for_parsing(content: str) -> str:
+    """
+    Remove comments from content for parsing, but preserve line structure.
+
+    Args:
+        content (str): The original file content
 
+    Returns:
+        str: Content with comments removed
+    """
+    if '#' not in content:
+        return content
 
-def _extract_code_blocks(content: str) -> List[Tuple[str, int, List[str]]]:
+    return '\n'.join(_remove_comments_lines(content))
+
+
+def _extract_code_blocks(lines: List[str]) -> List[Tuple[str, int, List[str]]]:
     """
     Extract data source and resource code blocks.
 
     Args:
-        content (str): The cleaned Terraform content
+        lines (List[str]): The cleaned Terraform content, split into lines
 
     Returns:
         List[Tuple[str, int, List[str]]]: List of (block_type, start_line, block_lines)
     """
-    lines = content.split('\n')
     blocks = []
     i = 0
     while i < len(lines):
@@ -199,42 +269,24 @@ def _extract_code_blocks(content: str) -> List[Tuple[str, int, List[str]]]:
         # Quoted: data "type" "name" { ... } or resource "type" "name" { ... } or provider "type" { ... } or locals { ... }
         # Single-quoted: data 'type' 'name' { ... } or resource 'type' 'name' { ... } or provider 'type' { ... } or locals { ... }
         # Unquoted: data type name { ... } or resource type name { ... } or provider type { ... } or locals { ... }
-        data_match = re.match(r'data\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
-        resource_match = re.match(r'resource\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
-        provider_match = re.match(r'provider\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
-        locals_match = re.match(r'locals\s*\{', line)
-        terraform_match = re.match(r'terraform\s*\{', line)
-        variable_match = re.match(r'variable\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
-        output_match = re.match(r'output\s+(?:"([^"]+)"|\'([^\']+)\'|([a-zA-Z_][a-zA-Z0-9_]*))\s*\{', line)
-
-        if data_match or resource_match or provider_match or locals_match or terraform_match or variable_match or output_match:
-            if data_match:
-                # Get data type and name from quoted, single-quoted, or unquoted groups
-                data_type = data_match.group(1) if data_match.group(1) else (data_match.group(2) if data_match.group(2) else data_match.group(3))
-                data_name = data_match.group(4) if data_match.group(4) else (data_match.group(5) if data_match.group(5) else data_match.group(6))
-                block_type = f"data.{data_type}.{data_name}"
-            elif resource_match:
-                # Get resource type and name from quoted, single-quoted, or unquoted groups
-                resource_type = resource_match.group(1) if resource_match.group(1) else (resource_match.group(2) if resource_match.group(2) else resource_match.group(3))
-                resource_name = resource_match.group(4) if resource_match.group(4) else (resource_match.group(5) if resource_match.group(5) else resource_match.group(6))
-                block_type = f"resource.{resource_type}.{resource_name}"
-            elif provider_match:
-                # Get provider type from quoted, single-quoted, or unquoted groups
-                provider_type = provider_match.group(1) if provider_match.group(1) else (provider_match.group(2) if provider_match.group(2) else provider_match.group(3))
-                block_type = f"provider.{provider_type}"
-            elif locals_match:
-                block_type = "locals"
-            elif terraform_match:
-                block_type = "terraform"
-            elif variable_match:
-                # Get variable name from quoted, single-quoted, or unquoted groups
-                variable_name = variable_match.group(1) if variable_match.group(1) else (variable_match.group(2) if variable_match.group(2) else variable_match.group(3))
-                block_type = f"variable.{variable_name}"
-            else:  # output_match
-                # Get output name from quoted, single-quoted, or unquoted groups
-                output_name = output_match.group(1) if output_match.group(1) else (output_match.group(2) if output_match.group(2) else output_match.group(3))
-                block_type = f"output.{output_name}"
-                
+        header_match = _BLOCK_HEADER_RE.match(line) if line.startswith(_BLOCK_KEYWORDS) else None
+
+        if header_match:
+            if header_match.group('two'):
+                # data or resource: get type and name from quoted, single-quoted, or unquoted groups
+                block_kind = header_match.group('two')
+                type_label = header_match.group(2) or header_match.group(3) or header_match.group(4)
+                name_label = header_match.group(5) or header_match.group(6) or header_match.group(7)
+                block_type = f"{block_kind}.{type_label}.{name_label}"
+            elif header_match.group('one'):
+                # provider, variable or output: get the single label from quoted, single-quoted, or unquoted groups
+                block_kind = header_match.group('one')
+                label = header_match.group(9) or header_match.group(10) or header_match.group(11)
+                block_type = f"{block_kind}.{label}"
+            else:
+                # locals or terraform
+                block_type = header_match.group('bare')
+
             start_line = i + 1
             block_lines = []
             brace_count = 1
@@ -250,16 +302,12 @@ def _extract_code_blocks(content: str) -> List[Tuple[str, int, List[str]]]:
                 while i < len(lines) and brace_count > 0:
                     current_line = lines[i]
                     block_lines.append(current_line)
-                    for char in current_line:
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
+                    brace_count += current_line.count('{') - current_line.count('}')
                     i += 1
 
                 # Remove the last line if it contains only the closing brace
                 if block_lines and block_lines[-1].strip() == '}':
-                    block_lines = block_lines[:-1]
+                    block_lines.pop()
 
             blocks.append((block_type, start_line, block_lines))
         else:
@@ -268,121 +316,344 @@ def _extract_code_blocks(content: str) -> List[Tuple[str, int, List[str]]]:
     return blocks
 
 
-def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, int]]]:
+class _Section(list):
     """
-    Split code block by empty lines and object boundaries into multiple sections.
-    
-    Note: block_lines is stored in the function closure for use in post-processing.
+    A code section: a list of line indices into the block being split that also records
+    the set of indents of its parameter lines, whether any line mentions 'description' and
+    whether it has any code line, so that these questions do not need to rescan the section.
+    """
+
+    def __init__(self, columns: '_BlockColumns', entries=()):
+        super().__init__()
+        # Per-line columns of the block being split
+        self.columns = columns
+        self.param_indents = set()
+        self.has_description = False
+        # Whether any line is neither blank nor a comment
+        self.has_code = False
+        # Set when the section becomes current again after being stored in sections or the
+        # section stack, i.e. when other references to it may exist and it must be copied to snapshot
+        self.shared = False
+        for line_idx in entries:
+            self.append(line_idx)
+
+    def append(self, line_idx: int) -> None:
+        super().append(line_idx)
+        columns = self.columns
+        indent = columns.param_indent[line_idx]
+        if indent >= 0:
+            self.param_indents.add(indent)
+        stripped = columns.stripped[line_idx]
+        if not self.has_description and 'description' in stripped:
+            self.has_description = True
+        if not self.has_code and stripped and not columns.is_comment[line_idx]:
+            self.has_code = True
+
+    def has_param_at(self, indent: int) -> bool:
+        """Whether any parameter line in the section has the given indent."""
+        return indent in self.param_indents
+
+    def has_param_not_at(self, indent: int) -> bool:
+        """Whether any parameter line in the section has an indent other than the given one."""
+        return len(self.param_indents) > 1 or (bool(self.param_indents) and indent not in self.param_indents)
+
+    def split_by_indent(self, indent: int) -> Tuple['_Section', '_Section']:
+        """
+        Split into new sections: parameters at the given indent together with non-parameter
+        lines (comments, etc.), and parameters at any other indent. Line order is kept.
+        """
+        param_indent = self.columns.param_indent
+        same_indent_section = _Section(self.columns, [
+            line_idx for line_idx in self if param_indent[line_idx] in (-1, indent)])
+        different_indent_section = _Section(self.columns, [
+            line_idx for line_idx in self if param_indent[line_idx] not in (-1, indent)])
+        return same_indent_section, different_indent_section
+
+
+def _last_section_with_param_at(sections: List[_Section], indent: int) -> int:
+    """
+    Find the most recent section that has a parameter line at the given indent.
+
+    Args:
+        sections: Sections collected so far
+        indent: Parameter indent to look for
+
+    Returns:
+        int: Index into sections, or -1 if no section has a parameter at that indent
+    """
+    for sec_idx in range(len(sections) - 1, -1, -1):
+        if indent in sections[sec_idx].param_indents:
+            return sec_idx
+    return -1
+
+
+def _pop_last_section_with_param_at(sections: List[_Section], indent: int) -> Optional[_Section]:
+    """
+    Remove and return the most recent section that has a parameter line at the given indent.
+
+    Args:
+        sections: Sections collected so far
+        indent: Parameter indent to look for
+
+    Returns:
+        Optional[_Section]: The removed section, or None if no section has a parameter at that indent
+    """
+    sec_idx = _last_section_with_param_at(sections, indent)
+    if sec_idx < 0:
+        return None
+    section = sections.pop(sec_idx)
+    section.shared = True
+    return section
+
+
+class _BlockColumns(NamedTuple):
     """
-    # Store block_lines for use in post-processing merge logic
-    _split_into_code_sections._block_lines = block_lines
+    Per-line columns of a code block, computed in one pass by _scan_block_lines and indexed by
+    line index, so that lines are not re-stripped, re-measured or re-split every time the
+    section splitting visits them.
+    """
+    stripped: List[str]
+    indents: List[int]
+    is_comment: List[bool]
+    has_eq: List[bool]
+    # Indent of parameter lines ('=' and not a comment), -1 for other lines
+    param_indent: List[int]
+    # Text after the first '=' (stripped), '' if the line has no '='
+    after_eq: List[str]
+    # Value is a known function call opening an object/array, e.g. jsonencode({
+    opens_func_call: List[bool]
+    braces_balanced: List[bool]
+    brackets_balanced: List[bool]
+    # Last character of the stripped line ('' for blank lines), e.g. '{' or '[' for lines opening a block
+    line_end: List[str]
+    # Line opens an object inside a list, e.g. "param = list(object({"
+    opens_list_object: List[bool]
+    # Type constructor mentioned by the line: 'list_object' if it contains both "list(" and "object(",
+    # 'object' if it contains only "object(", '' otherwise
+    object_declaration: List[str]
+    # Line starts with '}', contains '})', or contains '}' and ends with ')' - e.g. }, }), })), ]})
+    closes_object: List[bool]
+    # Nearest previous code line (not blank or comment) with a smaller indent, -1 if none
+    parent_idx: List[int]
+    # Nearest previous code line opening a function call (see opens_func_call), -1 if none
+    prev_func_call: List[int]
+    # Nearest function call line among the code lines a backward search from the line would visit
+    # (the line's parent and everything after it), i.e. the call the line sits inside, -1 if none
+    enclosing_func_call: List[int]
+    # Brace and bracket levels after each line. Only code lines outside heredoc bodies change them,
+    # by their net count of unmatched braces/brackets (balanced ones on the same line, e.g.
+    # {for ...} or [for ...], cancel out; parentheses are ignored). Levels never go negative.
+    brace_levels: List[int]
+    bracket_levels: List[int]
+    # True for lines inside a heredoc (after the start line, before the terminator)
+    in_heredoc_body: List[bool]
+    # Number of blank lines before each line index, with one more entry for the end of the block,
+    # so lines a+1 .. b-1 contain a blank line when blank_counts[b] - blank_counts[a + 1] > 0
+    blank_counts: List[int]
+
+
+def _scan_block_lines(block_lines: List[str]) -> _BlockColumns:
+    """
+    Compute the per-line columns of a code block in a single forward pass.
+
+    Args:
+        block_lines (List[str]): Lines within a code block
+
+    Returns:
+        _BlockColumns: Per-line columns indexed by line index
+    """
+    stripped = []
+    indents = []
+    is_comment = []
+    has_eq = []
+    param_indent = []
+    after_eq = []
+    opens_func_call = []
+    braces_balanced = []
+    brackets_balanced = []
+    line_end = []
+    opens_list_object = []
+    object_declaration = []
+    closes_object = []
+    # parent_idx is built with a stack of code line indices whose indents strictly increase
+    parent_idx = []
+    ancestor_stack = []
+    prev_func_call = []
+    enclosing_func_call = []
+    last_func_call_idx = -1
+    brace_levels = []
+    bracket_levels = []
+    brace_level = 0
+    bracket_level = 0
+    # Heredoc scan state: None outside a heredoc, otherwise the terminator being waited for
+    in_heredoc_body = []
+    heredoc_terminator = None
+    blank_counts = [0]
+    blank_count = 0
+    for idx, line in enumerate(block_lines):
+        line_stripped = line.strip()
+        if not line_stripped:
+            blank_count += 1
+        blank_counts.append(blank_count)
+        line_indent = len(line) - len(line.lstrip())
+        line_is_comment = line_stripped.startswith('#')
+        stripped.append(line_stripped)
+        indents.append(line_indent)
+        is_comment.append(line_is_comment)
+        line_has_eq = '=' in line_stripped
+        has_eq.append(line_has_eq)
+        param_indent.append(line_indent if line_has_eq and not line_is_comment else -1)
+        # The line is already stripped, so only the start of the value needs stripping
+        line_after_eq = line_stripped[line_stripped.find('=') + 1:].lstrip() if line_has_eq else ''
+        after_eq.append(line_after_eq)
+        line_opens_func_call = (line_after_eq.startswith(FUNCTION_PATTERNS) and
+                                ('{' in line_after_eq or '[' in line_after_eq))
+        opens_func_call.append(line_opens_func_call)
+        prev_func_call.append(last_func_call_idx)
+        if line_stripped == '' or line_is_comment:
+            parent_idx.append(-1)
+            enclosing_func_call.append(-1)
+        else:
+            while ancestor_stack and indents[ancestor_stack[-1]] >= line_indent:
+                ancestor_stack.pop()
+            parent = ancestor_stack[-1] if ancestor_stack else -1
+            parent_idx.append(parent)
+            enclosing_func_call.append(last_func_call_idx if last_func_call_idx >= parent else -1)
+            ancestor_stack.append(idx)
+            if line_opens_func_call:
+                last_func_call_idx = idx
+        open_braces = line.count('{')
+        close_braces = line.count('}')
+        open_brackets = line.count('[')
+        close_brackets = line.count(']')
+        braces_balanced.append(open_braces == close_braces and open_braces > 0)
+        brackets_balanced.append(open_brackets == close_brackets and open_brackets > 0)
+        last_char = line_stripped[-1:]
+        line_end.append(last_char)
+        if 'object(' in line_stripped:
+            line_object_declaration = 'list_object' if 'list(' in line_stripped else 'object'
+        else:
+            line_object_declaration = ''
+        object_declaration.append(line_object_declaration)
+        opens_list_object.append(last_char == '{' and line_object_declaration == 'list_object')
+        closes_object.append(close_braces > 0 and (line_stripped.startswith('}') or '})' in line_stripped or
+                                                   line_stripped.endswith(')')))
+
+        # The terminator line ends the heredoc and is processed like a normal line,
+        # including checking it for the start of another heredoc (<<EOF, <<-EOF, etc.)
+        line_in_heredoc_body = heredoc_terminator is not None and line_stripped != heredoc_terminator
+        in_heredoc_body.append(line_in_heredoc_body)
+        if not line_in_heredoc_body and line_stripped and not line_is_comment:
+            brace_level += open_braces - close_braces
+            if brace_level < 0:
+                brace_level = 0  # Ensure level doesn't go negative (unbalanced or malformed input)
+            bracket_level += open_brackets - close_brackets
+            if bracket_level < 0:
+                bracket_level = 0
+        brace_levels.append(brace_level)
+        bracket_levels.append(bracket_level)
+        if line_in_heredoc_body:
+            continue
+        heredoc_match = HEREDOC_RE.search(line) if '<<' in line else None
+        heredoc_terminator = heredoc_match.group(1) if heredoc_match else None
+
+    return _BlockColumns(
+        stripped, indents, is_comment, has_eq, param_indent, after_eq, opens_func_call,
+        braces_balanced, brackets_balanced, line_end, opens_list_object, object_declaration, closes_object,
+        parent_idx, prev_func_call, enclosing_func_call, brace_levels, bracket_levels, in_heredoc_body,
+        blank_counts)
+
+
+def _split_into_code_sections(block_lines: List[str], columns: _BlockColumns) -> List[List[int]]:
     """
     Split code block by empty lines and object boundaries into multiple sections.
 
     Args:
         block_lines (List[str]): Lines within a code block
+        columns (_BlockColumns): Per-line columns of block_lines
 
     Returns:
-        List[List[Tuple[str, int]]]: Sections with (line_content, line_index) tuples
+        List[List[int]]: Sections as lists of line indices into block_lines
     """
+    # Bind the columns to locals by name for the per-line loop
+    stripped = columns.stripped
+    indents = columns.indents
+    is_comment = columns.is_comment
+    has_eq = columns.has_eq
+    param_indent = columns.param_indent
+    after_eq = columns.after_eq
+    opens_func_call = columns.opens_func_call
+    braces_balanced = columns.braces_balanced
+    brackets_balanced = columns.brackets_balanced
+    line_end = columns.line_end
+    opens_list_object = columns.opens_list_object
+    object_declaration = columns.object_declaration
+    closes_object = columns.closes_object
+    parent_idx = columns.parent_idx
+    prev_func_call = columns.prev_func_call
+    enclosing_func_call = columns.enclosing_func_call
+    brace_levels = columns.brace_levels
+    bracket_levels = columns.bracket_levels
+    in_heredoc_body = columns.in_heredoc_body
+    blank_counts = columns.blank_counts
+
     sections = []
-    current_section = []
+    current_section = _Section(columns)
     # Stack to track sections when entering object({ internal parameters
     # When we enter object({ internal params, we push current_section to stack
     # When we exit with }), we pop and continue with the previous section
     section_stack = []
-    brace_level = 0
-    bracket_level = 0
-    prev_brace_level = 0
-    prev_bracket_level = 0
-    
-    # Track heredoc state to skip content inside heredoc blocks
-    in_heredoc = False
-    heredoc_terminator = None
 
-    for line_idx, line in enumerate(block_lines):
-        prev_brace_level = brace_level
-        prev_bracket_level = bracket_level
-        stripped_line = line.strip()
-        
-        # Check for heredoc end pattern first (before checking start)
-        # The terminator must be at the beginning of the line (after stripping)
-        if in_heredoc and heredoc_terminator:
-            if stripped_line == heredoc_terminator:
-                in_heredoc = False
-                heredoc_terminator = None
-                # Continue to process the terminator line if it contains '=' or boundary markers
+    for line_idx in range(len(block_lines)):
+        stripped_line = stripped[line_idx]
         
-        # Skip lines inside heredoc blocks (but not the heredoc start line itself)
-        if in_heredoc:
+        # Skip lines inside heredoc blocks (but not the heredoc start or terminator lines)
+        if in_heredoc_body[line_idx]:
             continue
         
-        # Check for heredoc start pattern (<<EOF, <<-EOF, etc.)
-        # Match <<EOF or <<-EOF at the end of a line
-        heredoc_match = re.search(r'<<-?([A-Z]+)\s*$', line)
-        if heredoc_match:
-            in_heredoc = True
-            heredoc_terminator = heredoc_match.group(1)
-            # Continue to process the heredoc start line if it contains '=' or boundary markers
-        
         if stripped_line == '':
             # Empty line always splits sections, regardless of brace/bracket level
             if current_section:
                 sections.append(current_section)
-                current_section = []
+                current_section = _Section(columns)
             continue
-        elif stripped_line.startswith('#'):
+        elif is_comment[line_idx]:
             # Skip comment lines but don't split sections
             continue
         else:
             # Check if braces/brackets are balanced on the same line (e.g., {for ...}, [for ...] expressions)
             # This check should be done before tracking brace/bracket levels to avoid false positives
-            open_braces = line.count('{')
-            close_braces = line.count('}')
-            open_brackets = line.count('[')
-            close_brackets = line.count(']')
-            braces_balanced_on_line = (open_braces == close_braces and open_braces > 0)
-            brackets_balanced_on_line = (open_brackets == close_brackets and open_brackets > 0)
-            
-            # Track brace and bracket levels before processing
-            # Only increment level when left brackets/braces exceed right brackets/braces on the same line
-            # This excludes cases where brackets/braces are balanced on the same line (e.g., {for ...}, [for ...])
-            # Note: parentheses are ignored for level tracking
-            net_brace_change = open_braces - close_braces
-            net_bracket_change = open_brackets - close_brackets
+            braces_balanced_on_line = braces_balanced[line_idx]
+            brackets_balanced_on_line = brackets_balanced[line_idx]
+            # Per-line classification from the column pass, shared by the branches below
+            line_has_eq = has_eq[line_idx]
+            last_char = line_end[line_idx]
             
-            # Only change level when there's a net change (unmatched brackets/braces)
-            # This ensures that balanced brackets/braces on the same line don't affect level
-            if net_brace_change > 0:
-                # More opening braces than closing braces - increment level
-                brace_level += net_brace_change
-            elif net_brace_change < 0:
-                # More closing braces than opening braces - decrement level
-                brace_level = max(0, brace_level + net_brace_change)  # Ensure level doesn't go negative
-            
-            if net_bracket_change > 0:
-                # More opening brackets than closing brackets - increment level
-                bracket_level += net_bracket_change
-            elif net_bracket_change < 0:
-                # More closing brackets than opening brackets - decrement level
-                bracket_level = max(0, bracket_level + net_bracket_change)  # Ensure level doesn't go negative
+            # Brace and bracket levels after this line, and the bracket level before it
+            brace_level = brace_levels[line_idx]
+            bracket_level = bracket_levels[line_idx]
+            prev_bracket_level = bracket_levels[line_idx - 1] if line_idx > 0 else 0
             
             # Check if we're entering an object within a list (list(object({ form))
             # This happens in structures like: cache_http_status_and_ttl = list(object({
             # When we encounter a line that contains list(object({, we should start a new section
             # for the parameters inside the object (which will be on subsequent lines)
             # This check must come BEFORE the simple object({ check to handle list(object({ correctly
-            if 'list(' in stripped_line and 'object(' in stripped_line and stripped_line.endswith('{'):
+            if opens_list_object[line_idx]:
                 # This is a list(object({ declaration line
                 # Add it to current section, then start a new section for nested parameters
                 # Create a copy of current_section to push to stack (since we'll append it to sections)
                 # This ensures we can return to it after })) and add subsequent parameters to it
-                current_section.append((line, line_idx))
+                current_section.append(line_idx)
                 # Don't append to sections yet - we'll do that when we exit the nested structure
-                # Instead, push a copy of current_section so we can continue adding to it after }))
-                # Use list() to create a copy, not a reference
-                section_stack.append(list(current_section))  # Remember the section with list(object({ declaration
-                current_section = []
+                # Instead, push current_section so we can continue adding to it after }))
+                # A copy is only needed when the list may also be referenced from sections or the stack
+                # (e.g. restored after object({), otherwise nothing else can observe it
+                if current_section.shared:
+                    section_stack.append(_Section(columns, current_section))  # Remember the section with list(object({ declaration
+                else:
+                    section_stack.append(current_section)
+                current_section = _Section(columns)
                 continue
             
             # Check if we're entering an object (parameter = { form)
@@ -391,172 +662,63 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
             # Only "param = {" internal parameters should create new grouping
             # Note: "param = object({" also should align with other parameters at the same level
             # Also skip if braces are balanced on the same line (e.g., {for ...} expressions)
-            if brace_level >= 1 and stripped_line.endswith('{') and not braces_balanced_on_line:
+            if brace_level >= 1 and last_char == '{' and not braces_balanced_on_line:
                 # Check if this is a simple "parameter = {" form (not "parameter = object({")
-                if '=' in stripped_line:
-                    after_equals = stripped_line.split('=', 1)[1].strip()
+                if line_has_eq:
+                    after_equals = after_eq[line_idx]
                     # Don't create new grouping for "param = {" declaration
                     # It should stay in the same group to align with other params at the same level
                     # Internal parameters will create new grouping when encountered
                     if after_equals == '{':
                         # "param = {" declaration - check if we need to split section by indent level
                         # If current_section has parameters with different indent levels, we should split
-                        # However, don't split if we're inside a function call (e.g., jsonencode({...}))
-                        # Check if any ancestor line contains a function call ending with {
-                        current_indent = len(line) - len(line.lstrip())
-                        is_inside_function_call = False
-                        
-                        # Search backwards through block_lines to find if we're inside a function call
-                        # Look for a line with lower indent that has a function call
-                        search_idx = line_idx - 1
-                        while search_idx >= 0:
-                            search_line = block_lines[search_idx]
-                            search_stripped = search_line.strip()
-                            if search_stripped == '' or search_stripped.startswith('#'):
-                                search_idx -= 1
-                                continue
-                            search_indent = len(search_line) - len(search_line.lstrip())
-                            # If we find a line with lower indent, check if it's a function call
-                            if search_indent < current_indent:
-                                if '=' in search_line:
-                                    search_after_equals = search_line.split('=', 1)[1].strip()
-                                    # Match common Terraform functions that can contain objects/arrays
-                                    function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                                         'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                                    if search_after_equals and any(search_after_equals.startswith(pattern) for pattern in function_patterns):
-                                        if '{' in search_after_equals or '[' in search_after_equals:
-                                            is_inside_function_call = True
-                                            break
-                                # If we find a parameter at lower indent, stop searching
-                                break
-                            search_idx -= 1
-                        
-                        # Also check current_section for function calls
-                        if not is_inside_function_call and current_section:
-                            # Check if the last line in current_section contains a function call ending with {
-                            # We need to check all previous lines in the section, not just the last one
-                            for prev_line, _ in reversed(current_section):
-                                if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                    # Check if this is a function call like jsonencode({, merge({, etc.
-                                    prev_after_equals = prev_line.split('=', 1)[1].strip() if '=' in prev_line else ''
-                                    # Match common Terraform functions that can contain objects/arrays
-                                    function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                                         'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                                    if prev_after_equals and any(prev_after_equals.startswith(pattern) for pattern in function_patterns):
-                                        if '{' in prev_after_equals or '[' in prev_after_equals:
-                                            is_inside_function_call = True
-                                            break
-                                    # If we find a parameter at the same indent level, we're not inside a function call
-                                    prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                    if prev_indent == current_indent:
-                                        break
+                        current_indent = indents[line_idx]
                         
-                        if not is_inside_function_call:
-                            if current_section:
-                                # Check if there are parameters with different indent levels in current_section
-                                has_different_indent = False
-                                for prev_line, _ in current_section:
-                                    if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                        prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                        if prev_indent != current_indent:
-                                            has_different_indent = True
-                                            break
+                        # Split the section by indent level, both outside and inside function calls
+                        # (e.g. jsonencode({...}), whose parameters stay together at the same indent)
+                        if current_section:
+                            # Check if there are parameters with different indent levels in current_section
+                            has_different_indent = current_section.has_param_not_at(current_indent)
+                            
+                            if has_different_indent:
+                                # Split section: keep parameters with same indent as current line
+                                # Parameters with different indent should go to previous section
+                                # Non-parameter lines (comments, etc.) are kept with the same indent section
+                                same_indent_section, different_indent_section = current_section.split_by_indent(current_indent)
                                 
-                                if has_different_indent:
-                                    # Split section: keep parameters with same indent as current line
-                                    # Parameters with different indent should go to previous section
-                                    same_indent_section = []
-                                    different_indent_section = []
-                                    for prev_line, prev_idx in current_section:
-                                        if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                            prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                            if prev_indent == current_indent:
-                                                same_indent_section.append((prev_line, prev_idx))
-                                            else:
-                                                different_indent_section.append((prev_line, prev_idx))
-                                        else:
-                                            # Non-parameter lines (comments, etc.) - keep with same indent section
-                                            same_indent_section.append((prev_line, prev_idx))
-                                    
-                                    if different_indent_section:
-                                        # Add different indent parameters to previous section
-                                        sections.append(different_indent_section)
-                                    # Continue with same indent section
-                                    current_section = same_indent_section
+                                if different_indent_section:
+                                    # Add different indent parameters to previous section
+                                    sections.append(different_indent_section)
+                                # Continue with same indent section
+                                current_section = same_indent_section
                         # "param = {" declaration will be added to current section below
-                        # If we're inside a function call, check if we should split section
-                        # For function calls like jsonencode({...}), parameters inside should be in the same section
-                        # if they have the same indent level, but should be split if they have different indent levels
-                        elif is_inside_function_call:
-                            # Inside function call, check if we should split section based on indent
-                            if current_section:
-                                # Check if there are parameters with different indent levels in current_section
-                                has_different_indent = False
-                                for prev_line, _ in current_section:
-                                    if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                        prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                        if prev_indent != current_indent:
-                                            has_different_indent = True
-                                            break
-                                
-                                if has_different_indent:
-                                    # Split section: keep parameters with same indent as current line
-                                    # Parameters with different indent should go to previous section
-                                    same_indent_section = []
-                                    different_indent_section = []
-                                    for prev_line, prev_idx in current_section:
-                                        if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                            prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                            if prev_indent == current_indent:
-                                                same_indent_section.append((prev_line, prev_idx))
-                                            else:
-                                                different_indent_section.append((prev_line, prev_idx))
-                                        else:
-                                            # Non-parameter lines (comments, etc.) - keep with same indent section
-                                            same_indent_section.append((prev_line, prev_idx))
-                                    
-                                    if different_indent_section:
-                                        # Add different indent parameters to previous section
-                                        sections.append(different_indent_section)
-                                    # Continue with same indent section
-                                    current_section = same_indent_section
-                            else:
-                                # current_section is empty, but we're inside a function call
-                                # Check if the previous line was an empty line (which splits sections)
-                                # If so, we should NOT merge with previous section, even if we're in a function call
-                                # Empty lines should always create new sections
-                                prev_line_was_empty = False
-                                if line_idx > 0:
-                                    prev_line = block_lines[line_idx - 1]
-                                    if prev_line.strip() == '':
-                                        prev_line_was_empty = True
-                                
-                                # Only merge if previous line was NOT empty
-                                # Empty lines should always split sections, even in function calls
-                                if not prev_line_was_empty and sections:
-                                    # Look for the last section that has parameters at the same indent level
-                                    # We need to check all sections, not just the last one, because
-                                    # sections might have been split due to closing braces
-                                    found_section_to_merge = False
-                                    for sec_idx in range(len(sections) - 1, -1, -1):
-                                        prev_section = sections[sec_idx]
-                                        # Check if this section has parameters at the same indent level
-                                        for prev_line, prev_idx in prev_section:
-                                            if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                                prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                                if prev_indent == current_indent:
-                                                    # Found a section with parameters at the same indent level
-                                                    # Merge current line into that section
-                                                    found_section_to_merge = True
-                                                    sections.pop(sec_idx)
-                                                    current_section = prev_section
-                                                    break
-                                        if found_section_to_merge:
-                                            break
-                                # If no section with same indent was found, or previous line was empty,
-                                # start a new current_section
-                                # This ensures that parameters separated by empty lines are in different sections
-                                # even if they're at the same indent level within a function call
+                        # An empty section is only merged back when the parent line (the first line above
+                        # with lower indent) is a function call ending with { (e.g. jsonencode({...}))
+                        elif parent_idx[line_idx] >= 0 and opens_func_call[parent_idx[line_idx]]:
+                            # current_section is empty, but we're inside a function call
+                            # Check if the previous line was an empty line (which splits sections)
+                            # If so, we should NOT merge with previous section, even if we're in a function call
+                            # Empty lines should always create new sections
+                            prev_line_was_empty = False
+                            if line_idx > 0:
+                                if stripped[line_idx - 1] == '':
+                                    prev_line_was_empty = True
+                            
+                            # Only merge if previous line was NOT empty
+                            # Empty lines should always split sections, even in function calls
+                            if not prev_line_was_empty and sections:
+                                # Look for the last section that has parameters at the same indent level
+                                # We need to check all sections, not just the last one, because
+                                # sections might have been split due to closing braces
+                                merged_section = _pop_last_section_with_param_at(sections, current_indent)
+                                if merged_section is not None:
+                                    # Found a section with parameters at the same indent level
+                                    # Merge current line into that section
+                                    current_section = merged_section
+                            # If no section with same indent was found, or previous line was empty,
+                            # start a new current_section
+                            # This ensures that parameters separated by empty lines are in different sections
+                            # even if they're at the same indent level within a function call
             
             # Check if we're entering an array (parameter = [ form)
             # When encountering '[', we should NOT create new grouping for "param = [" declaration
@@ -564,45 +726,20 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
             # Only "param = [" internal elements should create new grouping
             # This is similar to "param = {" handling above
             # Also skip if brackets are balanced on the same line (e.g., [for ...] expressions)
-            if bracket_level == 1 and stripped_line.endswith('[') and not brackets_balanced_on_line:
+            if bracket_level == 1 and last_char == '[' and not brackets_balanced_on_line:
                 # Check if this is a simple "parameter = [" form
-                if '=' in stripped_line:
-                    after_equals = stripped_line.split('=', 1)[1].strip()
+                if line_has_eq:
+                    after_equals = after_eq[line_idx]
                     if after_equals == '[':
                         # "param = [" declaration - check if we need to split section by indent level
                         # If current_section has parameters with different indent levels, we should split
-                        current_indent = len(line) - len(line.lstrip())
+                        current_indent = indents[line_idx]
                         # Check if we're inside a function call (e.g., jsonencode({...}))
-                        is_inside_function_call = False
-                        search_idx = line_idx - 1
-                        while search_idx >= 0:
-                            search_line = block_lines[search_idx]
-                            search_stripped = search_line.strip()
-                            if search_stripped == '' or search_stripped.startswith('#'):
-                                search_idx -= 1
-                                continue
-                            search_indent = len(search_line) - len(search_line.lstrip())
-                            if '=' in search_line:
-                                search_after_equals = search_line.split('=', 1)[1].strip()
-                                function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                                     'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                                if search_after_equals and any(search_after_equals.startswith(pattern) for pattern in function_patterns):
-                                    if '{' in search_after_equals or '[' in search_after_equals:
-                                        is_inside_function_call = True
-                                        break
-                            if search_indent < current_indent:
-                                break
-                            search_idx -= 1
+                        is_inside_function_call = enclosing_func_call[line_idx] >= 0
                         
                         if current_section:
                             # Check if there are parameters with different indent levels in current_section
-                            has_different_indent = False
-                            for prev_line, _ in current_section:
-                                if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                    prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                    if prev_indent != current_indent:
-                                        has_different_indent = True
-                                        break
+                            has_different_indent = current_section.has_param_not_at(current_indent)
                             
                             if has_different_indent:
                                 # Check if we just exited a top-level array and this is a top-level param
@@ -613,37 +750,20 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                                     # Check if the previous line was closing a top-level array
                                     # Look for closing bracket/brace patterns in the previous line
                                     if line_idx > 0:
-                                        prev_line_content = block_lines[line_idx - 1]
-                                        prev_line_stripped = prev_line_content.strip()
+                                        prev_line_stripped = stripped[line_idx - 1]
                                         # Check if previous line closes an array (contains ']' or '])')
                                         # Accept patterns like ']', '])', '])', etc.
                                         if ']' in prev_line_stripped:
                                             # Check if current_section has top-level params at the same indent
-                                            has_top_level_in_section = False
-                                            for prev_line, _ in current_section:
-                                                if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                                    prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                                    if prev_indent == current_indent:
-                                                        has_top_level_in_section = True
-                                                        break
+                                            has_top_level_in_section = current_section.has_param_at(current_indent)
                                             if has_top_level_in_section:
                                                 should_keep_together = True
                                 
                                 if not should_keep_together:
                                     # Split section: keep parameters with same indent as current line
                                     # Parameters with different indent should go to previous section
-                                    same_indent_section = []
-                                    different_indent_section = []
-                                    for prev_line, prev_idx in current_section:
-                                        if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                            prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                            if prev_indent == current_indent:
-                                                same_indent_section.append((prev_line, prev_idx))
-                                            else:
-                                                different_indent_section.append((prev_line, prev_idx))
-                                        else:
-                                            # Non-parameter lines (comments, etc.) - keep with same indent section
-                                            same_indent_section.append((prev_line, prev_idx))
+                                    # Non-parameter lines (comments, etc.) are kept with the same indent section
+                                    same_indent_section, different_indent_section = current_section.split_by_indent(current_indent)
                                     
                                     if different_indent_section:
                                         # Add different indent parameters to previous section
@@ -659,73 +779,38 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                                 # Look for the last section that has parameters at the same indent level
                                 # We need to check all sections, not just the last one, because
                                 # sections might have been split due to closing braces
-                                found_section_to_merge = False
-                                for sec_idx in range(len(sections) - 1, -1, -1):
-                                    prev_section = sections[sec_idx]
-                                    # Check if this section has parameters at the same indent level
-                                    for prev_line, prev_idx in prev_section:
-                                        if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                            prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                            if prev_indent == current_indent:
-                                                # Found a section with parameters at the same indent level
-                                                # Merge current line into that section
-                                                found_section_to_merge = True
-                                                sections.pop(sec_idx)
-                                                current_section = prev_section
-                                                break
-                                    if found_section_to_merge:
-                                        break
+                                merged_section = _pop_last_section_with_param_at(sections, current_indent)
+                                if merged_section is not None:
+                                    # Found a section with parameters at the same indent level
+                                    # Merge current line into that section
+                                    current_section = merged_section
                         # "param = [" declaration will be added to current section below
                         # Don't create new section - it should align with other params at the same level
             
-            # Check if we're in an array and encountering a standalone '{' (new object element)
-            # This happens in structures like: default = [ { ... }, { ... } ]
-            # However, if we're still inside an object (brace_level > 0), we should NOT clear current_section
-            # because the array declaration and subsequent parameters should align with each other
-            # Also skip if braces/brackets are balanced on the same line (e.g., {for ...}, [for ...] expressions)
-            # Also skip if we're inside a function call (e.g., jsonencode({...}))
-            is_inside_function_call_for_array = False
-            if line_idx > 0:
-                prev_line_in_block = block_lines[line_idx - 1]
-                if '=' in prev_line_in_block and not prev_line_in_block.strip().startswith('#'):
-                    prev_after_equals = prev_line_in_block.split('=', 1)[1].strip() if '=' in prev_line_in_block else ''
-                    function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                         'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                    if prev_after_equals and any(prev_after_equals.startswith(pattern) for pattern in function_patterns):
-                        if '{' in prev_after_equals or '[' in prev_after_equals:
-                            is_inside_function_call_for_array = True
-            
-            if bracket_level >= 1 and stripped_line == '{' and '=' not in stripped_line and not braces_balanced_on_line and not is_inside_function_call_for_array:
-                # Starting a new object within an array
-                # Only clear current_section if we're at the top level (brace_level == 0)
-                # If we're still inside an object, keep current_section so subsequent parameters can align
-                if brace_level == 0:
-                    # Top-level array with object elements
-                    if current_section:
-                        sections.append(current_section)
-                        current_section = []
-                # If brace_level > 0, we're still inside an object, so don't clear current_section
-                # The object element will be added to current_section below
+            # A standalone '{' (new object element in an array, e.g. default = [ { ... }, { ... } ]) needs
+            # no handling here: brace_level already counts that '{', so it is never the top level and
+            # current_section is kept so the element aligns with the array declaration
             
             # Check if we're entering parameters inside object({, list(object({, or simple param = {
             # When we encounter a parameter line inside these structures, we need to ensure it's in a new section
             # But only if the previous line was the declaration, not if it's another parameter at the same level
             # Also skip if the braces/brackets are balanced on the same line (e.g., {for ...}, [for ...] expressions)
             # If braces/brackets are balanced on the same line, skip this check entirely
-            if (brace_level >= 1 and '=' in stripped_line and not stripped_line.endswith('{') and not stripped_line.endswith('[') and 
+            if (brace_level >= 1 and line_has_eq and last_char != '{' and last_char != '[' and
                 not braces_balanced_on_line and not brackets_balanced_on_line):
                 # We're inside an object, and this is a parameter line
                 # Check if the previous line in current_section contains "object(", "list(object(", or ends with "= {"
                 if current_section:
-                        last_line_content = current_section[-1][0] if current_section else ""
+                        last_line_content = block_lines[current_section[-1]] if current_section else ""
+                        last_object_declaration = object_declaration[current_section[-1]]
                         # Check if the last line contains object({ pattern (but not list(object({ which is handled separately)
-                        if 'object(' in last_line_content and '{' in last_line_content:
+                        if last_object_declaration and '{' in last_line_content:
                             # Check if it's list(object({ (already handled above) or simple object({
-                            if not ('list(' in last_line_content):
+                            if last_object_declaration == 'object':
                                 # The previous line was object({ declaration
                                 # Check if this parameter has more indentation (is actually inside the object)
-                                current_indent = len(line) - len(line.lstrip())
-                                last_indent = len(last_line_content) - len(last_line_content.lstrip())
+                                current_indent = indents[line_idx]
+                                last_indent = indents[current_section[-1]]
                                 if current_indent > last_indent:
                                     # This parameter is inside the object
                                     # We need to create a new section for object({ internal params
@@ -734,62 +819,56 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                                     # Push current_section to stack so we can return to it after })
                                     sections.append(current_section)
                                     section_stack.append(current_section)  # Remember the section with object({ declaration
-                                    current_section = []
+                                    current_section = _Section(columns)
                             elif bracket_level >= 1:
                                 # The previous line was list(object({ declaration (nested)
-                                # Check if this is a nested list(object({ inside another list(object({
-                                # If so, we need to handle it similarly to the top-level list(object({
-                                # by pushing current_section to stack instead of adding to sections
-                                if 'list(' in last_line_content and 'object(' in last_line_content:
-                                    # This is a nested list(object({ declaration
-                                    # Push a copy of current_section to stack so we can return to it after }))
-                                    current_section.append((line, line_idx))
-                                    section_stack.append(list(current_section))
-                                    current_section = []
-                                    continue
+                                # This is a nested list(object({ inside another list(object({, so we handle
+                                # it similarly to the top-level list(object({ by pushing current_section
+                                # to stack instead of adding to sections
+                                # Push current_section to stack so we can return to it after })),
+                                # copying it only when it may also be referenced from sections or the stack
+                                current_section.append(line_idx)
+                                if current_section.shared:
+                                    section_stack.append(_Section(columns, current_section))
                                 else:
-                                    # The previous line was list(object({ declaration, but this is not a nested list(object({
-                                    # This means we're entering parameters inside the outer list(object({
-                                    # We should NOT push current_section to stack here because it's already in the stack
-                                    # from when we encountered the outer list(object({ declaration
-                                    # Just continue, the parameter will be added to current_section below
-                                    pass
+                                    section_stack.append(current_section)
+                                current_section = _Section(columns)
+                                continue
                         # Check if the last line is a simple "param = {" declaration
                         # OR if the last line ends with '{' (could be "param = {", "param = flatten([...])", etc.)
                         elif '=' in last_line_content and last_line_content.endswith('{'):
-                            after_equals_last = last_line_content.split('=', 1)[1].strip()
+                            after_equals_last = after_eq[current_section[-1]]
                             if after_equals_last == '{':
                                 # The previous line was "param = {" declaration
                                 # Check if this parameter has more indentation (is actually inside the object)
-                                current_indent = len(line) - len(line.lstrip())
-                                last_indent = len(last_line_content) - len(last_line_content.lstrip())
+                                current_indent = indents[line_idx]
+                                last_indent = indents[current_section[-1]]
                                 if current_indent > last_indent:
                                     # This parameter is inside the "param = {" object
                                     # Create a new section for internal params
                                     # Push current_section to stack so we can return to it after })
                                     sections.append(current_section)
                                     section_stack.append(current_section)  # Remember the section with "param = {" declaration
-                                    current_section = []
+                                    current_section = _Section(columns)
                             else:
                                 # The previous line ends with '{' but is not "param = {" (e.g., "param = flatten([...])")
                                 # Check if this parameter has more indentation (is actually inside the object/expression)
-                                current_indent = len(line) - len(line.lstrip())
-                                last_indent = len(last_line_content) - len(last_line_content.lstrip())
+                                current_indent = indents[line_idx]
+                                last_indent = indents[current_section[-1]]
                                 if current_indent > last_indent:
                                     # This parameter is inside the object/expression
                                     # Create a new section for internal params
                                     # Push current_section to stack so we can return to it after })
                                     sections.append(current_section)
                                     section_stack.append(current_section)  # Remember the section with the declaration
-                                    current_section = []
+                                    current_section = _Section(columns)
             
             # Check if we're exiting an object
             # When we encounter }), })), }, etc., we need to check if we should return to previous section
             # This happens when we were in object({ internal params and now exiting with })
             # Check if line starts with } or contains }) pattern (like }), })), }, etc.)
             # Skip if braces/brackets are balanced on the same line (e.g., {for ...} or [for ...] expressions)
-            if ((stripped_line.startswith('}') or '})' in stripped_line or (stripped_line.endswith(')') and '}' in stripped_line)) and
-                not braces_balanced_on_line and not brackets_balanced_on_line):
+            if closes_object[line_idx] and not braces_balanced_on_line and not brackets_balanced_on_line:
                 # If we have a section in the stack, it means we were in object({ internal params
                 # and we should return to the previous section (which contains object({ declaration)
                 # so that subsequent parameters at the same level can align with object({ declaration
@@ -806,53 +885,35 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                     # by comparing the indent level of the next parameter with the indent level of the declaration
                     # in the sections on the stack
                     current_section = section_stack.pop()
+                    current_section.shared = True
                     # Add the }) or })) line to the previous section so it's part of the same group
-                    current_section.append((line, line_idx))
+                    current_section.append(line_idx)
                     # Check if the next line is a parameter at the same indent level as the declaration
                     # If so, we should keep it in the same section to ensure proper alignment
                     # This ensures that parameters like 'default' and 'nullable' after list(object({...}))
                     # are in the same section as 'type' and 'description' for proper alignment
-                    if line_idx + 1 < len(block_lines):
-                        next_line = block_lines[line_idx + 1]
-                        next_stripped = next_line.strip()
+                    # Only a switch to a stacked section containing description and type changes anything
+                    # below, so skip the declaration lookup unless current_section lacks them and the
+                    # next section in the stack contains them
+                    if (line_idx + 1 < len(block_lines) and section_stack and
+                            not current_section.has_description and section_stack[-1].has_description):
                         # Check if next line is a parameter (contains '=' and not a comment)
-                        if '=' in next_line and not next_stripped.startswith('#'):
-                            next_indent = len(next_line) - len(next_line.lstrip())
+                        if has_eq[line_idx + 1] and not is_comment[line_idx + 1]:
+                            next_indent = indents[line_idx + 1]
                             # Find the indent of the declaration parameter in current_section
                             # Look for the parameter that contains object({ or list(object({
-                            declaration_indent = None
-                            for prev_line, prev_idx in current_section:
-                                if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                    if 'object(' in prev_line or ('list(' in prev_line and 'object(' in prev_line):
-                                        declaration_indent = len(prev_line) - len(prev_line.lstrip())
-                                        break
-                            # If we found a declaration, check if next line has the same indent
-                            if declaration_indent is not None:
-                                if next_indent == declaration_indent:
-                                    # Next parameter is at the same indent level as declaration
-                                    # This means we're exiting the outer list(object({ and should restore
-                                    # the section containing description and type
-                                    # Don't split section - it will be added to current_section in the next iteration
-                                    pass
-                                elif next_indent < declaration_indent:
-                                    # Next parameter is at a lower indent level than the declaration in current_section
-                                    # This means we're exiting the outer list(object({ and should restore
-                                    # the section containing description and type
-                                    # However, if current_section doesn't contain description and type,
-                                    # we need to check if there's another section in the stack
-                                    if section_stack:
-                                        has_description_in_current = any('description' in line for line, _ in current_section)
-                                        if not has_description_in_current:
-                                            # current_section doesn't contain description and type
-                                            # Check if the next section in the stack contains them
-                                            if section_stack:
-                                                next_section = section_stack[-1]
-                                                has_description_in_next = any('description' in line for line, _ in next_section)
-                                                if has_description_in_next:
-                                                    # The next section in the stack contains description and type
-                                                    # We should use that section instead
-                                                    current_section = section_stack.pop()
-                                                    current_section.append((line, line_idx))
+                            declaration_indent = next((param_indent[prev_idx] for prev_idx in current_section
+                                                       if param_indent[prev_idx] >= 0 and object_declaration[prev_idx]),
+                                                      None)
+                            # If next_indent == declaration_indent, the next parameter is at the same indent
+                            # level as the declaration and will be added to current_section in the next iteration
+                            if declaration_indent is not None and next_indent < declaration_indent:
+                                # Next parameter is at a lower indent level than the declaration in current_section
+                                # This means we're exiting the outer list(object({ and should restore
+                                # the section containing description and type, which is the next one in the stack
+                                current_section = section_stack.pop()
+                                current_section.shared = True
+                                current_section.append(line_idx)
                     continue
                 elif brace_level == 0:
                     # Exiting top-level object grouping
@@ -860,90 +921,29 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                     # This handles cases like locals blocks where a parameter value ends with }]]) 
                     # but the next line is another parameter that should be in the same section
                     # Also handle cases like jsonencode({...}) where parameters inside should be in the same section
-                    should_split = True
-                    if line_idx + 1 < len(block_lines):
-                        next_line = block_lines[line_idx + 1]
-                        next_stripped = next_line.strip()
-                        # Check if next line is a parameter (contains '=' and not a comment)
-                        if '=' in next_line and not next_stripped.startswith('#'):
-                            # Check if next line has the same indent as parameters in current_section
-                            next_indent = len(next_line) - len(next_line.lstrip())
-                            # Find the indent of parameters in current_section
-                            # Also check if we're inside a function call (e.g., jsonencode({...}))
-                            # If so, parameters at the same indent level should stay in the same section
-                            is_inside_function_call = False
-                            # Check if we're inside a function call by searching backwards from current line
-                            search_idx = line_idx - 1
-                            while search_idx >= 0:
-                                search_line = block_lines[search_idx]
-                                search_stripped = search_line.strip()
-                                if search_stripped == '' or search_stripped.startswith('#'):
-                                    search_idx -= 1
-                                    continue
-                                search_indent = len(search_line) - len(search_line.lstrip())
-                                if '=' in search_line:
-                                    search_after_equals = search_line.split('=', 1)[1].strip()
-                                    function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                                         'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                                    if search_after_equals and any(search_after_equals.startswith(pattern) for pattern in function_patterns):
-                                        if '{' in search_after_equals or '[' in search_after_equals:
-                                            is_inside_function_call = True
-                                            break
-                                if search_indent < next_indent:
-                                    break
-                                search_idx -= 1
-                            
-                            # If we're inside a function call, check if next line has the same indent as parameters in current_section
-                            if is_inside_function_call:
-                                if current_section:
-                                    # Check if next line has the same indent as parameters in current_section
-                                    for prev_line, prev_idx in current_section:
-                                        if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                            prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                            if prev_indent == next_indent:
-                                                # Next line is a parameter at the same indent level, don't split
-                                                should_split = False
-                                                break
-                                else:
-                                    # current_section is empty, but we're inside a function call
-                                    # Check if there's a previous section with parameters at the same indent level
-                                    # If so, we should NOT split, but instead merge with that section
-                                    if sections:
-                                        for sec_idx in range(len(sections) - 1, -1, -1):
-                                            prev_section = sections[sec_idx]
-                                            # Check if this section has parameters at the same indent level
-                                            found_same_indent = False
-                                            for prev_line, prev_idx in prev_section:
-                                                if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                                    prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                                    if prev_indent == next_indent:
-                                                        # Found a section with parameters at the same indent level
-                                                        # Don't split - we'll merge with this section when we add the next line
-                                                        found_same_indent = True
-                                                        should_split = False
-                                                        break
-                                            if found_same_indent:
-                                                break
-                            else:
-                                # Not inside function call, check normally
-                                for prev_line, prev_idx in current_section:
-                                    if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                        prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                        if prev_indent == next_indent:
-                                            # Next line is a parameter at the same indent level, don't split
-                                            should_split = False
-                                            break
-                    if should_split:
-                        if current_section:
+                    # Inside a function call the same rule applies: parameters at the same indent stay
+                    # together. When current_section is empty there is nothing to split, so whether we
+                    # are inside a function call never changes the outcome and is not looked up
+                    if current_section:
+                        should_split = True
+                        if line_idx + 1 < len(block_lines):
+                            # Check if next line is a parameter (contains '=' and not a comment)
+                            if has_eq[line_idx + 1] and not is_comment[line_idx + 1]:
+                                # Check if next line has the same indent as parameters in current_section
+                                next_indent = indents[line_idx + 1]
+                                if current_section.has_param_at(next_indent):
+                                    # Next line is a parameter at the same indent level, don't split
+                                    should_split = False
+                        if should_split:
                             sections.append(current_section)
-                            current_section = []
+                            current_section = _Section(columns)
             
             # Check if we're exiting an array
             # When we encounter ], we need to check if we should exit array grouping
             # Check if line starts with ] or is exactly ']'
             # However, if we're still inside an object (brace_level > 0), we should NOT clear current_section
             # because subsequent parameters at the same level should align with the array declaration
-            if bracket_level == 0 and (stripped_line == ']' or stripped_line.startswith(']')):
+            if bracket_level == 0 and stripped_line.startswith(']'):
                 # Exiting array grouping
                 # Only clear current_section if we're also exiting the top-level object (brace_level == 0)
                 # If we're still inside an object, keep current_section so subsequent parameters can align
@@ -955,25 +955,16 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                     if prev_bracket_level > 0:
                         # We just exited a top-level array
                         # Check if current_section has top-level parameters (parameters at the same indent as the array declaration)
-                        has_top_level_params = False
-                        if current_section:
-                            for prev_line, prev_idx in current_section:
-                                if '=' in prev_line and not prev_line.strip().startswith('#'):
-                                    prev_indent = len(prev_line) - len(prev_line.lstrip())
-                                    # Check if this is a top-level parameter (indent of 2 spaces in locals/resource blocks)
-                                    if prev_indent == 2:
-                                        has_top_level_params = True
-                                        break
+                        # A top-level parameter has an indent of 2 spaces in locals/resource blocks
+                        has_top_level_params = current_section.has_param_at(2)
                         
                         if has_top_level_params:
                             # Keep current_section so subsequent top-level params can join it for alignment
                             # The array closing line will be added to current_section below
                             # Check if the next line is a top-level param - if so, ensure it stays in the same section
                             if line_idx + 1 < len(block_lines):
-                                next_line = block_lines[line_idx + 1]
-                                next_stripped = next_line.strip()
-                                if '=' in next_line and not next_stripped.startswith('#'):
-                                    next_indent = len(next_line) - len(next_line.lstrip())
+                                if has_eq[line_idx + 1] and not is_comment[line_idx + 1]:
+                                    next_indent = indents[line_idx + 1]
                                     if next_indent == 2:
                                         # Next line is a top-level param - keep current_section so it can join
                                         pass
@@ -981,17 +972,17 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                             # No top-level params in current_section, split normally
                             if current_section:
                                 sections.append(current_section)
-                                current_section = []
+                                current_section = _Section(columns)
                     else:
                         # Not exiting from an array, split normally
                         if current_section:
                             sections.append(current_section)
-                            current_section = []
+                            current_section = _Section(columns)
                 # If brace_level > 0, we're still inside an object, so don't clear current_section
                 # The array closing line will be added to current_section below
             
             # Add line to current section
-            current_section.append((line, line_idx))
+            current_section.append(line_idx)
 
     # Add final section if exists
     if current_section:
@@ -1005,64 +996,43 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
     while i < len(sections):
         current_sec = sections[i]
         # Check if this section has top-level parameters (indent=2)
-        has_top_level = False
-        top_level_params = []
-        for line, idx in current_sec:
-            if '=' in line and not line.strip().startswith('#'):
-                indent = len(line) - len(line.lstrip())
-                if indent == 2:
-                    has_top_level = True
-                    top_level_params.append((line, idx))
-        
-        if has_top_level and len(top_level_params) > 0:
+        has_top_level = current_sec.has_param_at(2)
+        
+        if has_top_level:
             # This section has top-level params - check if any subsequent section also has top-level params
             # Skip intermediate sections without top-level params (they may contain nested params or empty lines)
             # If so, merge them
             merged_sec = list(current_sec)
+            # The gap checks below compare against current_sec itself, which merging does not change
+            current_sec_last_idx = max(current_sec) if current_sec else -1
             j = i + 1
             while j < len(sections):
                 next_sec = sections[j]
-                next_has_top_level = False
-                for line, idx in next_sec:
-                    if '=' in line and not line.strip().startswith('#'):
-                        indent = len(line) - len(line.lstrip())
-                        if indent == 2:
-                            next_has_top_level = True
-                            break
+                next_has_top_level = next_sec.has_param_at(2)
                 
                 if next_has_top_level:
                     # Check if there's a gap in line indices between current_sec and next_sec
                     # A gap due to empty lines should prevent merging, but gaps due to array/object content should allow merging
                     # This ensures that parameters separated by empty lines stay in different sections,
                     # but parameters separated by array closures can be merged (for alignment)
-                    current_sec_last_idx = max(idx for _, idx in current_sec) if current_sec else -1
-                    next_sec_first_idx = min(idx for _, idx in next_sec) if next_sec else -1
+                    next_sec_first_idx = min(next_sec) if next_sec else -1
                     
                     # If there's a gap, check if it's due to an empty line
                     if current_sec_last_idx >= 0 and next_sec_first_idx >= 0:
                         gap = next_sec_first_idx - current_sec_last_idx
                         if gap > 1:
                             # Check if the gap contains an empty line
-                            # Access block_lines from function closure
-                            block_lines = getattr(_split_into_code_sections, '_block_lines', [])
-                            has_empty_line_in_gap = False
-                            for gap_idx in range(current_sec_last_idx + 1, next_sec_first_idx):
-                                if gap_idx < len(block_lines):
-                                    if block_lines[gap_idx].strip() == '':
-                                        has_empty_line_in_gap = True
-                                        break
-                            
-                            if has_empty_line_in_gap:
+                            if blank_counts[next_sec_first_idx] - blank_counts[current_sec_last_idx + 1] > 0:
                                 # Gap contains an empty line - don't merge (empty lines should split sections)
                                 break
                             # Gap doesn't contain empty line (likely array/object content) - allow merging
                     
                     # Merge next section into current section
-                    merged_sec_set = {(line, idx) for line, idx in merged_sec}
-                    for line, idx in next_sec:
-                        if (line, idx) not in merged_sec_set:
-                            merged_sec.append((line, idx))
-                            merged_sec_set.add((line, idx))
+                    merged_idx_set = set(merged_sec)
+                    for idx in next_sec:
+                        if idx not in merged_idx_set:
+                            merged_sec.append(idx)
+                            merged_idx_set.add(idx)
                     sections.pop(j)
                     # Don't increment j since we removed an element - continue checking next section
                     continue
@@ -1070,28 +1040,14 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                     # Next section doesn't have top-level params
                     # Only skip it if ALL its parameters are nested (indent > 2) or it has no parameters
                     # If it has any parameters at indent=2, we should stop merging (they belong to a different group)
-                    has_top_level_like_params = False
-                    has_any_params = False
-                    for line, _ in next_sec:
-                        if '=' in line and not line.strip().startswith('#'):
-                            has_any_params = True
-                            indent = len(line) - len(line.lstrip())
-                            if indent == 2:
-                                # Found a parameter at indent=2 - this might be a different top-level group
-                                # Stop merging to avoid incorrectly merging different groups
-                                has_top_level_like_params = True
-                                break
+                    # A parameter at indent=2 might be a different top-level group
+                    # Stop merging to avoid incorrectly merging different groups
+                    has_top_level_like_params = next_has_top_level
+                    has_any_params = bool(next_sec.param_indents)
                     
                     # First check if this section is empty (contains only empty lines)
                     # Empty sections should prevent merging (empty lines should split sections)
-                    is_empty_section = True
-                    for line, _ in next_sec:
-                        stripped = line.strip()
-                        if stripped and not stripped.startswith('#'):
-                            is_empty_section = False
-                            break
-                    
-                    if is_empty_section:
+                    if not next_sec.has_code:
                         # Empty section - stop merging (empty lines should split sections)
                         break
                     
@@ -1118,6 +1074,11 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
             i += 1
     
     sections = merged_top_level_sections
+
+    # Without any function call line no parameter is inside a function call, and the two passes
+    # below would return the sections unchanged
+    if not any(opens_func_call):
+        return sections
     
     # Post-process: Merge sections that contain parameters at the same indent level within function calls
     # This handles cases where parameters like cache_key = { are separated from other parameters
@@ -1126,143 +1087,85 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
     # Then, merge sections containing parameters at the same indent level within the same function call.
     
     # Step 1: Separate parameters inside function calls from those outside
+    # Each section is swept twice: once to classify its lines, once to distribute them
+    # into the separated sections
     separated_sections = []
     for current_sec in sections:
-        param_lines = [(line, idx) for line, idx in current_sec if '=' in line and not line.strip().startswith('#')]
+        params_inside_function = []  # (line_idx, function_call_line_idx)
+        params_outside_function = []  # line_idx
+        non_param_idx_set = set()
+        
+        for line_idx in current_sec:
+            if param_indent[line_idx] < 0:
+                non_param_idx_set.add(line_idx)
+                continue
+            
+            # Check whether the parent line (the first line above with lower indent) is a function call
+            # Only the parent qualifies: the parameter must be inside the function call's argument list,
+            # i.e. indented deeper than the function call line
+            function_call_line_idx = parent_idx[line_idx]
+            if function_call_line_idx >= 0 and opens_func_call[function_call_line_idx]:
+                params_inside_function.append((line_idx, function_call_line_idx))
+            else:
+                params_outside_function.append(line_idx)
         
-        if len(param_lines) == 0:
-            # No parameters, keep as is
+        if not params_inside_function:
+            # No parameters, or only parameters outside function calls, keep the section as is
             separated_sections.append(current_sec)
             continue
         
-        # Separate parameters inside function calls from those outside
-        params_inside_function = []  # (line_content, line_idx, indent, function_call_line_idx, function_call_line_content)
-        params_outside_function = []  # (line_content, line_idx)
-        non_param_lines = [(line, idx) for line, idx in current_sec if '=' not in line or line.strip().startswith('#')]
-        
-        for line_content, line_idx in param_lines:
-            current_indent = len(block_lines[line_idx]) - len(block_lines[line_idx].lstrip())
-            
-            # Search backwards to find if we're inside a function call
-            # Only consider parameters that are actually inside function call argument lists (inside braces/brackets)
-            is_inside_function_call = False
-            function_call_line_idx = None
-            search_idx = line_idx - 1
-            while search_idx >= 0:
-                search_line = block_lines[search_idx]
-                search_stripped = search_line.strip()
-                if search_stripped == '' or search_stripped.startswith('#'):
-                    search_idx -= 1
-                    continue
-                search_indent = len(search_line) - len(search_line.lstrip())
-                if '=' in search_line:
-                    search_after_equals = search_line.split('=', 1)[1].strip()
-                    function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                         'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                    if search_after_equals and any(search_after_equals.startswith(pattern) for pattern in function_patterns):
-                        if '{' in search_after_equals or '[' in search_after_equals:
-                            # Found a function call, but we need to verify that current parameter is actually inside it
-                            # Check if current parameter's indent is greater than function call line's indent
-                            # This ensures we only separate parameters that are truly inside the function call's argument list
-                            if current_indent > search_indent:
-                                is_inside_function_call = True
-                                function_call_line_idx = search_idx
-                                break
-                if search_indent < current_indent:
-                    break
-                search_idx -= 1
-            
-            if is_inside_function_call and function_call_line_idx is not None:
-                function_call_line_content = block_lines[function_call_line_idx].strip()
-                params_inside_function.append((line_content, line_idx, current_indent, function_call_line_idx, function_call_line_content))
+        # Group parameters inside function calls by function call and indent level
+        function_call_groups = {}
+        # The function call line index identifies the call, its content is not part of the key
+        for line_idx, func_call_idx in params_inside_function:
+            function_call_groups.setdefault((func_call_idx, indents[line_idx]), []).append(line_idx)
+        
+        # One section for the outside parameters (if any) and one for each function call group,
+        # each including the non-param lines that lie between its first and last parameter
+        group_params_list = list(function_call_groups.values())
+        if params_outside_function:
+            group_params_list.insert(0, params_outside_function)
+        group_secs = [[] for _ in group_params_list]
+        group_bounds = [(min(group_params), max(group_params)) for group_params in group_params_list]
+        group_of_param = {}
+        for group_pos, group_params in enumerate(group_params_list):
+            for line_idx in group_params:
+                group_of_param[line_idx] = group_pos
+        
+        for idx in current_sec:
+            if idx in non_param_idx_set:
+                for group_pos, (first_idx, last_idx) in enumerate(group_bounds):
+                    if first_idx <= idx <= last_idx:
+                        group_secs[group_pos].append(idx)
             else:
-                params_outside_function.append((line_content, line_idx))
-        
-        # If we have both types of parameters, we need to split the section
-        if params_outside_function and params_inside_function:
-            # Create a section for outside parameters
-            outside_param_set = set(params_outside_function)
-            outside_sec = []
-            for line, idx in current_sec:
-                if (line, idx) in outside_param_set:
-                    outside_sec.append((line, idx))
-                elif (line, idx) in non_param_lines:
-                    # Include non-param lines that are between outside parameters
-                    # Check if this line is between outside parameters
-                    outside_indices = [idx for _, idx in params_outside_function]
-                    if outside_indices and min(outside_indices) <= idx <= max(outside_indices):
-                        outside_sec.append((line, idx))
-            if outside_sec:
-                separated_sections.append(outside_sec)
-        
-        # If we have parameters inside function calls, create separate sections for each function call group
-        if params_inside_function:
-            # Group parameters by function call and indent level
-            function_call_groups = {}
-            for line_content, line_idx, indent, func_call_idx, func_call_content in params_inside_function:
-                key = (func_call_idx, func_call_content, indent)
-                if key not in function_call_groups:
-                    function_call_groups[key] = []
-                function_call_groups[key].append((line_content, line_idx))
-            
-            # Create a section for each group
-            for (func_call_idx, func_call_content, indent), group_params in function_call_groups.items():
-                group_param_set = set(group_params)
-                group_sec = []
-                for line, idx in current_sec:
-                    if (line, idx) in group_param_set:
-                        group_sec.append((line, idx))
-                    elif (line, idx) in non_param_lines:
-                        # Include non-param lines that are between these parameters
-                        group_indices = [idx for _, idx in group_params]
-                        if group_indices and min(group_indices) <= idx <= max(group_indices):
-                            group_sec.append((line, idx))
-                if group_sec:
-                    separated_sections.append(group_sec)
-        
-        # If we only have parameters outside function calls, keep the section as is
-        if params_outside_function and not params_inside_function:
-            separated_sections.append(current_sec)
+                group_secs[group_of_param[idx]].append(idx)
+        
+        for group_sec in group_secs:
+            if group_sec:
+                separated_sections.append(group_sec)
     
     # Step 2: Merge sections containing parameters at the same indent level within the same function call
     merged_sections = []
     i = 0
     while i < len(separated_sections):
         current_sec = separated_sections[i]
-        param_lines = [(line, idx) for line, idx in current_sec if '=' in line and not line.strip().startswith('#')]
+        param_lines = [idx for idx in current_sec if param_indent[idx] >= 0]
         
         if len(param_lines) == 1:
             # Single parameter section - check if it's inside a function call
-            line_content, line_idx = param_lines[0]
-            current_indent = len(block_lines[line_idx]) - len(block_lines[line_idx].lstrip())
+            line_idx = param_lines[0]
+            current_indent = indents[line_idx]
             
             # Search backwards to find if we're inside a function call
             is_inside_function_call = False
             function_call_line_idx = None
-            search_idx = line_idx - 1
-            while search_idx >= 0:
-                search_line = block_lines[search_idx]
-                search_stripped = search_line.strip()
-                if search_stripped == '' or search_stripped.startswith('#'):
-                    search_idx -= 1
-                    continue
-                search_indent = len(search_line) - len(search_line.lstrip())
-                if '=' in search_line:
-                    search_after_equals = search_line.split('=', 1)[1].strip()
-                    function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                         'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                    if search_after_equals and any(search_after_equals.startswith(pattern) for pattern in function_patterns):
-                        if '{' in search_after_equals or '[' in search_after_equals:
-                            is_inside_function_call = True
-                            function_call_line_idx = search_idx
-                            break
-                if search_indent < current_indent:
-                    break
-                search_idx -= 1
+            if enclosing_func_call[line_idx] >= 0:
+                is_inside_function_call = True
+                function_call_line_idx = enclosing_func_call[line_idx]
             
             if is_inside_function_call and function_call_line_idx is not None:
                 # Get the function call line content for comparison (strip for comparison)
-                function_call_line_content = block_lines[function_call_line_idx].strip()
+                function_call_line_content = stripped[function_call_line_idx]
                 
                 # Look for the next section with parameters at the same indent level within the same function call
                 merged_sec = list(current_sec)
@@ -1271,7 +1174,7 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                 while j < len(separated_sections):
                     next_sec = separated_sections[j]
                     # Check if next section has parameters at the same indent level
-                    next_param_lines = [(line, idx) for line, idx in next_sec if '=' in line and not line.strip().startswith('#')]
+                    next_param_lines = [idx for idx in next_sec if param_indent[idx] >= 0]
                     if not next_param_lines:
                         # No parameters in this section, skip it
                         j += 1
@@ -1279,32 +1182,20 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                     
                     has_same_indent = False
                     is_same_function_call = False
-                    for next_line_content, next_line_idx in next_param_lines:
-                        next_indent = len(block_lines[next_line_idx]) - len(block_lines[next_line_idx].lstrip())
+                    for next_line_idx in next_param_lines:
+                        next_indent = indents[next_line_idx]
                         if next_indent == current_indent:
                             # Check if it's inside the same function call by comparing function call line content
-                            next_search_idx = next_line_idx - 1
-                            while next_search_idx >= 0:
-                                next_search_line = block_lines[next_search_idx]
-                                next_search_stripped = next_search_line.strip()
-                                if next_search_stripped == '' or next_search_stripped.startswith('#'):
-                                    next_search_idx -= 1
-                                    continue
-                                next_search_indent = len(next_search_line) - len(next_search_line.lstrip())
-                                if '=' in next_search_line:
-                                    next_search_after_equals = next_search_line.split('=', 1)[1].strip()
-                                    function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                                         'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                                    if next_search_after_equals and any(next_search_after_equals.startswith(pattern) for pattern in function_patterns):
-                                        if '{' in next_search_after_equals or '[' in next_search_after_equals:
-                                            # Check if this is the same function call by comparing stripped line content
-                                            if next_search_line.strip() == function_call_line_content:
-                                                has_same_indent = True
-                                                is_same_function_call = True
-                                                break
-                                if next_search_indent < next_indent:
+                            # Only function call lines can match, so hop between them down to the parent line
+                            next_search_idx = enclosing_func_call[next_line_idx]
+                            next_search_limit = max(parent_idx[next_line_idx], 0)
+                            while next_search_idx >= next_search_limit:
+                                # Check if this is the same function call by comparing stripped line content
+                                if stripped[next_search_idx] == function_call_line_content:
+                                    has_same_indent = True
+                                    is_same_function_call = True
                                     break
-                                next_search_idx -= 1
+                                next_search_idx = prev_func_call[next_search_idx]
                             if has_same_indent:
                                 break
                         elif next_indent < current_indent:
@@ -1313,11 +1204,11 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                     
                     if has_same_indent and is_same_function_call:
                         # Merge next section into current section (avoid duplicates)
-                        merged_sec_set = {(line, idx) for line, idx in merged_sec}
-                        for line, idx in next_sec:
-                            if (line, idx) not in merged_sec_set:
-                                merged_sec.append((line, idx))
-                                merged_sec_set.add((line, idx))
+                        merged_idx_set = set(merged_sec)
+                        for idx in next_sec:
+                            if idx not in merged_idx_set:
+                                merged_sec.append(idx)
+                                merged_idx_set.add(idx)
                         # Remove next section from sections list
                         separated_sections.pop(j)
                         found_match = True
@@ -1327,8 +1218,8 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
                     else:
                         # If indent is lower, we've left the function call scope, stop searching
                         if next_param_lines:
-                            next_line_content, next_line_idx = next_param_lines[0]
-                            next_indent = len(block_lines[next_line_idx]) - len(block_lines[next_line_idx].lstrip())
+                            next_line_idx = next_param_lines[0]
+                            next_indent = indents[next_line_idx]
                             if next_indent < current_indent:
                                 break
                         # Otherwise, continue to next section
@@ -1351,15 +1242,18 @@ def _split_into_code_sections(block_lines: List[str]) -> List[List[Tuple[str, in
 
 
 def _check_parameter_alignment_in_section(
-    section: List[Tuple[str, int]], block_type: str, block_start_line: int, block_lines: List[str] = None
+    section: List[int], block_type: str, block_start_line: int, block_lines: List[str],
+    columns: _BlockColumns
 ) -> List[Tuple[int, str]]:
     """
     Check parameter alignment in a code section.
 
     Args:
-        section: List of (line_content, relative_line_idx) tuples
+        section: List of relative line indices into block_lines
         block_type: Type of the block being checked
         block_start_line: Starting line number of the block
+        block_lines: Lines of the block that the section indices refer to
+        columns: Per-line columns of block_lines
 
     Returns:
         List[Tuple[int, str]]: List of (line_number, error_message) tuples
@@ -1370,64 +1264,25 @@ def _check_parameter_alignment_in_section(
     # Track heredoc state to skip content inside heredoc blocks
     in_heredoc = False
     heredoc_terminator = None
-    
-    # Check if this section is inside a function call (e.g., jsonencode({...}))
-    # However, we should still check alignment for parameters inside jsonencode({...})
-    # because they are object literals that should be aligned
-    # Only skip if we're inside function call parameters (not object literals)
-    is_inside_function_call = False
-    
-    if block_lines and section:
-        # Check each parameter line in the section to see if any is inside a function call
-        # We need to check all lines, not just the first one
-        for line_content, relative_line_idx in section:
-            if '=' not in line_content or line_content.strip().startswith('#'):
-                continue
-            
-            current_indent = len(block_lines[relative_line_idx]) - len(block_lines[relative_line_idx].lstrip())
-            
-            # Search backwards through block_lines to find if this line is inside a function call
-            search_idx = relative_line_idx - 1
-            while search_idx >= 0:
-                search_line = block_lines[search_idx]
-                search_stripped = search_line.strip()
-                if search_stripped == '' or search_stripped.startswith('#'):
-                    search_idx -= 1
-                    continue
-                search_indent = len(search_line) - len(search_line.lstrip())
-                # If we find a line with lower or equal indent, check if it's a function call
-                if search_indent <= current_indent:
-                    if '=' in search_line:
-                        search_after_equals = search_line.split('=', 1)[1].strip()
-                        # Match common Terraform functions that can contain objects/arrays
-                        function_patterns = ['jsonencode(', 'merge(', 'try(', 'lookup(', 'alltrue(', 'anytrue(', 
-                                             'cidrsubnet(', 'cidrhost(', 'flatten(', 'keys(', 'values(', 'zipmap(']
-                        if search_after_equals and any(search_after_equals.startswith(pattern) for pattern in function_patterns):
-                            # Check if the function call contains '{' or '[' on the same line
-                            # If so, the parameters inside are object/array literals that should be checked
-                            # Only skip if we're in function call parameters (not object literals)
-                            # For jsonencode({...}), merge({...}), etc., the content inside should be checked
-                            # because it's an object literal, not function parameters
-                            if '{' in search_after_equals or '[' in search_after_equals:
-                                # This is a function call with object/array literal on the same line
-                                # The parameters inside are object/array literals, not function parameters
-                                # So we should still check alignment for them
-                                # Only skip if we're actually in function call parameters (not object literals)
-                                # For now, we'll check alignment for object literals inside function calls
-                                pass
-                    # If we find a parameter at lower indent that's not a function call, stop searching
-                    if search_indent < current_indent:
-                        break
-                search_idx -= 1
+
+    stripped = columns.stripped
+    param_indent = columns.param_indent
+    blank_counts = columns.blank_counts
     
     # Note: We no longer skip alignment checks for sections inside function calls
     # because parameters inside jsonencode({...}), merge({...}), etc. are object literals
     # that should be checked for alignment
 
+    # Whether the section is (part of) a required_providers block, tested once for all its lines
+    section_has_required_providers = any('required_providers' in stripped[line_idx] for line_idx in section)
+
+    # Sections built by merging may list lines out of order, otherwise no group needs sorting below
+    parameter_lines_in_order = True
+
     # Extract parameter lines from section
-    for line_content, relative_line_idx in section:
-        line = line_content.rstrip()
-        line_stripped = line.strip()
+    for relative_line_idx in section:
+        line = block_lines[relative_line_idx].rstrip()
+        line_stripped = stripped[relative_line_idx]
         
         # Check for heredoc end pattern first (before checking start)
         # The terminator must be at the beginning of the line (after stripping)
@@ -1443,18 +1298,17 @@ def _check_parameter_alignment_in_section(
         
         # Check for heredoc start pattern (<<EOF, <<-EOF, etc.)
         # Match <<EOF or <<-EOF at the end of a line
-        heredoc_match = re.search(r'<<-?([A-Z]+)\s*$', line)
+        heredoc_match = HEREDOC_RE.search(line) if '<<' in line else None
         if heredoc_match:
             in_heredoc = True
             heredoc_terminator = heredoc_match.group(1)
             # Continue to process the heredoc start line if it contains '=' or boundary markers
         
-        if '=' in line and not line_stripped.startswith('#'):
+        if param_indent[relative_line_idx] >= 0:
             # Skip block declarations
-            if not re.match(r'^\s*(data|resource|variable|output|locals|module)\s+', line):
+            if not (line_stripped.startswith(BLOCK_DECL_KEYWORDS) and BLOCK_DECL_RE.match(line)):
                 # Skip provider declarations in required_providers blocks
-                if (re.match(r'^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*\{', line) and
-                    any('required_providers' in prev_line for prev_line, _ in section)):
+                if section_has_required_providers and _OBJECT_PARAM_RE.match(line):
                     continue
                 
                 # Skip lines that are part of expression content (e.g., inside condition = (...))
@@ -1464,7 +1318,9 @@ def _check_parameter_alignment_in_section(
                     # This is expression content, not a parameter assignment
                     continue
                 
-                parameter_lines.append((line, relative_line_idx))
+                if parameter_lines and relative_line_idx < parameter_lines[-1][1]:
+                    parameter_lines_in_order = False
+                parameter_lines.append((line, relative_line_idx, line.find('='), line_stripped))
 
     if len(parameter_lines) == 0:
         return errors
@@ -1474,19 +1330,26 @@ def _check_parameter_alignment_in_section(
     # This ensures that nested parameters (e.g., inside list(object({...}))) 
     # are not grouped with top-level parameters (e.g., default, nullable)
     indent_groups = {}
-    for line, relative_line_idx in parameter_lines:
-        line_with_spaces = line.expandtabs(2)
-        indent_spaces = len(line_with_spaces) - len(line_with_spaces.lstrip())
+    for parameter_line in parameter_lines:
+        line = parameter_line[0]
+        if '\t' in line:
+            line_with_spaces = line.expandtabs(2)
+            indent_spaces = len(line_with_spaces) - len(line_with_spaces.lstrip())
+        else:
+            # Without tabs the indent is the precomputed one, no expanded copy of the line is needed
+            indent_spaces = columns.indents[parameter_line[1]]
         indent_level = indent_spaces // 2  # Terraform uses 2 spaces per indent level
         
-        if indent_level not in indent_groups:
-            indent_groups[indent_level] = []
-        indent_groups[indent_level].append((line, relative_line_idx))
+        indent_groups.setdefault(indent_level, []).append(parameter_line)
 
     # Check each indentation group
     for indent_level, group_lines in indent_groups.items():
         # Sort group_lines by relative_line_idx to ensure correct order
-        group_lines_sorted = sorted(group_lines, key=lambda x: x[1])
+        # Groups keep the order of parameter_lines, so they are already sorted when it is
+        if parameter_lines_in_order:
+            group_lines_sorted = group_lines
+        else:
+            group_lines_sorted = sorted(group_lines, key=lambda x: x[1])
         
         # Split group by empty lines in the original block_lines
         # Parameters separated by empty lines should be in different alignment groups
@@ -1494,24 +1357,21 @@ def _check_parameter_alignment_in_section(
         current_sub_group = []
         prev_line_idx = None
         
-        for line, relative_line_idx in group_lines_sorted:
+        for parameter_line in group_lines_sorted:
+            relative_line_idx = parameter_line[1]
             if prev_line_idx is not None and block_lines:
                 # Check if there's an empty line between prev_line_idx and relative_line_idx
-                has_empty_line_between = False
-                for check_idx in range(prev_line_idx + 1, relative_line_idx):
-                    if check_idx < len(block_lines) and block_lines[check_idx].strip() == '':
-                        has_empty_line_between = True
-                        break
+                has_empty_line_between = blank_counts[relative_line_idx] - blank_counts[prev_line_idx + 1] > 0
                 
                 if has_empty_line_between:
                     # Empty line separates - start new sub-group
                     if current_sub_group:
                         sub_groups.append(current_sub_group)
-                    current_sub_group = [(line, relative_line_idx)]
+                    current_sub_group = [parameter_line]
                 else:
-                    current_sub_group.append((line, relative_line_idx))
+                    current_sub_group.append(parameter_line)
             else:
-                current_sub_group.append((line, relative_line_idx))
+                current_sub_group.append(parameter_line)
             
             prev_line_idx = relative_line_idx
         
@@ -1524,8 +1384,8 @@ def _check_parameter_alignment_in_section(
             errors.extend(group_errors)
             
             # Always check spacing for all parameters
-            for line, relative_line_idx in sub_group:
-                spacing_errors = _check_parameter_spacing(line, relative_line_idx, block_type, block_start_line)
+            for line, relative_line_idx, equals_pos, _ in sub_group:
+                spacing_errors = _check_parameter_spacing(line, relative_line_idx, equals_pos, block_type, block_start_line)
                 errors.extend(spacing_errors)
 
     return errors
@@ -1552,7 +1412,7 @@ def _has_st005_issue(line: str, indent_level: int, relative_line_idx: int = 0, b
 
 
 def _has_st008_issue(param_name: str, relative_line_idx: int, block_lines: List[str], 
-                     meta_parameters: List[str]) -> bool:
+                     meta_parameters: FrozenSet[str]) -> bool:
     """
     Check if line has ST.008 issue.
     ST.008 issue occurs ONLY when the parameter is a meta-parameter itself.
@@ -1565,8 +1425,6 @@ def _has_st008_issue(param_name: str, relative_line_idx: int, block_lines: List[
 def _should_skip_alignment_check(line: str, param_name: str, relative_line_idx: int,
                                   indent_level: int, block_lines: List[str] = None) -> bool:
     """Determine if alignment check should be skipped due to other rule issues."""
-    meta_parameters = ['count', 'for_each', 'provider', 'depends_on', 'lifecycle']
-    
     # Check ST.004 (tab character)
     if _has_st004_issue(line):
         return True
@@ -1576,19 +1434,18 @@ def _should_skip_alignment_check(line: str, param_name: str, relative_line_idx:
         return True
     
     # Check ST.008 (meta-parameter or multiple blank lines)
-    if _has_st008_issue(param_name, relative_line_idx, block_lines, meta_parameters):
+    if _has_st008_issue(param_name, relative_line_idx, block_lines, META_PARAMETERS):
         return True
     
     return False
 
 
-def _check_equals_after_spacing(line: str, relative_line_idx: int, block_type: str, 
+def _check_equals_after_spacing(line: str, relative_line_idx: int, equals_pos: int, block_type: str, 
                                 block_start_line: int) -> List[Tuple[int, str]]:
-    """Check space after equals sign (must be exactly 1 space)."""
+    """Check space after equals sign (must be exactly 1 space), equals_pos is line.find('=')."""
     errors = []
     actual_line_num = block_start_line + relative_line_idx + 1
     
-    equals_pos = line.find('=')
     if equals_pos == -1:
         return errors
     
@@ -1609,31 +1466,55 @@ def _check_equals_after_spacing(line: str, relative_line_idx: int, block_type: s
     return errors
 
 
+def _extract_param_name(before_equals: str) -> Optional[str]:
+    """
+    Extract the parameter name from the text before '='.
+
+    The text must be a single word, surrounded by optional whitespace and optionally enclosed
+    in matching single or double quotes, with no quote characters inside the name.
+
+    Returns:
+        Optional[str]: The parameter name without quotes, or None if the text is not a name
+    """
+    parts = before_equals.split()
+    if len(parts) != 1:
+        return None
+    name = parts[0]
+    if name[0] in '"\'':
+        if len(name) < 3 or name[-1] != name[0]:
+            return None
+        name = name[1:-1]
+    if '"' in name or "'" in name:
+        return None
+    return name
+
+
 def _check_group_alignment(
-    group_lines: List[Tuple[str, int]], 
+    group_lines: List[Tuple[str, int, int, str]], 
     indent_level: int, 
     block_type: str, 
     block_start_line: int,
     block_lines: List[str] = None
 ) -> List[Tuple[int, str]]:
-    """Check alignment within a group of parameters."""
+    """Check alignment within a group of (line, relative_line_idx, equals_pos, line_stripped) parameters."""
     errors = []
     
     # Extract parameter names and find longest
     param_data = []
-    for line, relative_line_idx in group_lines:
-        equals_pos = line.find('=')
+    # Whether any parameter name is double-quoted (e.g. "name" = ...)
+    has_quoted_params = False
+    for line, relative_line_idx, equals_pos, line_stripped in group_lines:
         if equals_pos == -1:
             continue
         
         # Skip array/list declarations
         before_equals = line[:equals_pos]
-        if before_equals.strip().startswith('[') or (before_equals.strip() == '' and line.strip().startswith('[')):
+        before_equals_stripped = before_equals.strip()
+        if before_equals_stripped.startswith('[') or (before_equals_stripped == '' and line_stripped.startswith('[')):
             continue
         
         # Skip lines that are part of expression content (e.g., inside condition = (...))
         # These lines start with '(' and contain comparison operators (==, !=) which are not parameter assignments
-        line_stripped = line.strip()
         if line_stripped.startswith('(') and ('==' in line or '!=' in line):
             # This is expression content, not a parameter assignment
             continue
@@ -1642,12 +1523,13 @@ def _check_group_alignment(
         after_equals = line[equals_pos + 1:].strip()
         is_nested_block = after_equals.startswith('{')
         
-        param_name_match = re.match(r'^\s*(["\']?)([^"\'=\s]+)\1\s*$', before_equals)
-        if param_name_match:
-            param_name = param_name_match.group(2)
+        param_name = _extract_param_name(before_equals)
+        if param_name is not None:
             # Include nested blocks for alignment checking
             # Don't skip them, they should still be aligned with other parameters
             param_data.append((param_name, line, relative_line_idx, equals_pos, is_nested_block))
+            if before_equals_stripped.startswith('"'):
+                has_quoted_params = True
     
     if len(param_data) < 1:
         return errors
@@ -1676,29 +1558,33 @@ def _check_group_alignment(
         
         return errors
     
-    # Find longest parameter name
-    longest_param_name_length = max(len(param_name) for param_name, _, _, _, _ in param_data) if param_data else 0
+    # Find longest parameter name, and the first parameter with a name of that length
+    longest_param_name_length = 0
+    longest_param_data = param_data[0]
+    for param_entry in param_data:
+        param_name_length = len(param_entry[0])
+        if param_name_length > longest_param_name_length:
+            longest_param_name_length = param_name_length
+            longest_param_data = param_entry
     
     indent_spaces = indent_level * 2  # Convert indent level back to spaces
     
-    # For tfvars files, check if most parameters are already aligned
-    # If so, use the aligned position as expected location
-    unique_equals_positions = {}
-    for param_name, line, relative_line_idx, equals_pos, is_nested_block in param_data:
-        if equals_pos not in unique_equals_positions:
-            unique_equals_positions[equals_pos] = []
-        unique_equals_positions[equals_pos].append((param_name, line, relative_line_idx, equals_pos))
-    
     # For tfvars files, use actual alignment if parameters are already aligned
     if block_type == "tfvars":
+        # For tfvars files, check if most parameters are already aligned
+        # If so, use the aligned position as expected location
+        # Only the number of parameters at each equals position is needed
+        unique_equals_positions = {}
+        for _, _, _, equals_pos, _ in param_data:
+            unique_equals_positions[equals_pos] = unique_equals_positions.get(equals_pos, 0) + 1
+        
         # If all parameters are already aligned at one position, use that position
         if len(unique_equals_positions) == 1:
             expected_equals_location = list(unique_equals_positions.keys())[0]
         elif len(unique_equals_positions) > 1:
             # More than one position, find the most common one
-            most_common_pos = max(unique_equals_positions.keys(), 
-                                key=lambda pos: len(unique_equals_positions[pos]))
-            most_common_count = len(unique_equals_positions[most_common_pos])
+            most_common_pos = max(unique_equals_positions.keys(), key=unique_equals_positions.get)
+            most_common_count = unique_equals_positions[most_common_pos]
             total_params = len(param_data)
             
             # If most parameters (> 50% and at least 2 params) are aligned at one position, use that position
@@ -1706,7 +1592,6 @@ def _check_group_alignment(
                 expected_equals_location = most_common_pos
             else:
                 # Calculate based on longest parameter name
-                longest_param_data = max(param_data, key=lambda x: len(x[0]))
                 longest_line = longest_param_data[1]
                 longest_equals_pos = longest_param_data[3]
                 longest_before_equals = longest_line[:longest_equals_pos]
@@ -1714,7 +1599,6 @@ def _check_group_alignment(
                 expected_equals_location = indent_spaces + longest_param_name_length + longest_quote_chars + 1
         else:
             # Calculate based on longest parameter name
-            longest_param_data = max(param_data, key=lambda x: len(x[0]))
             longest_line = longest_param_data[1]
             longest_equals_pos = longest_param_data[3]
             longest_before_equals = longest_line[:longest_equals_pos]
@@ -1723,25 +1607,17 @@ def _check_group_alignment(
     else:
         # Calculate expected equals location based on longest parameter name
         # Formula: indent_spaces + param_name_length + quote_chars + 1 (standard space before equals)
-        longest_param_data = max(param_data, key=lambda x: len(x[0]))
-        longest_line = longest_param_data[1]
-        longest_equals_pos = longest_param_data[3]
-        longest_before_equals = longest_line[:longest_equals_pos]
-        
-        # Check if ANY parameter in the group has quotes
+        # Check if ANY parameter in the group has quotes (has_quoted_params, collected above)
         # This ensures we use correct quote_chars even if longest param doesn't have quotes
-        has_quoted_params = any(
-            line[:line.find('=')].strip().startswith('"') 
-            for _, line, _, _, _ in param_data
-        )
         longest_quote_chars = 2 if has_quoted_params else 0
         
         expected_equals_location = indent_spaces + longest_param_name_length + longest_quote_chars + 1
     
+    # Per-group constants, so the per-parameter work below is a single subtraction
+    name_and_spaces_width = expected_equals_location - indent_spaces
+    
     # Check alignment for each parameter
     for param_name, line, relative_line_idx, equals_pos, is_nested_block in param_data:
-        actual_line_num = block_start_line + relative_line_idx + 1
-        
         # Skip alignment check if equals position matches expected location
         if equals_pos == expected_equals_location:
             continue
@@ -1750,7 +1626,8 @@ def _check_group_alignment(
         if _should_skip_alignment_check(line, param_name, relative_line_idx, indent_level, block_lines):
             continue
             
-        required_spaces_before_equals = expected_equals_location - indent_spaces - len(param_name)
+        actual_line_num = block_start_line + relative_line_idx + 1
+        required_spaces_before_equals = name_and_spaces_width - len(param_name)
         
         if equals_pos < expected_equals_location:
             errors.append((
@@ -1772,12 +1649,13 @@ def _check_group_alignment(
 def _check_parameter_spacing(
     line: str, 
     relative_line_idx: int, 
+    equals_pos: int, 
     block_type: str, 
     block_start_line: int
 ) -> List[Tuple[int, str]]:
     """Check spacing around equals sign - only check space after equals sign."""
     # Use the dedicated function for checking space after equals
-    return _check_equals_after_spacing(line, relative_line_idx, block_type, block_start_line)
+    return _check_equals_after_spacing(line, relative_line_idx, equals_pos, block_type, block_start_line)
 
 
 def get_rule_description() -> dict:
@@ -1921,29 +1799,6 @@ variable "instance_name" {
     }
 
 
-def _has_blank_line_between(lines: List[str], start_line_idx: int, end_line_idx: int) -> bool:
-    """
-    Check if there's a blank line between two line indices in the original content.
-    Only counts truly empty lines, ignores comment-only lines.
-    
-    Args:
-        lines: Original content lines
-        start_line_idx: Start line index (0-based)
-        end_line_idx: End line index (0-based)
-    
-    Returns:
-        bool: True if there's a blank line between the two indices
-    """
-    for i in range(start_line_idx + 1, end_line_idx):
-        if i >= len(lines):
-            break
-        stripped = lines[i].strip()
-        # True blank line: empty string
-        if stripped == '':
-            return True
-    return False
-
-
 def _is_equals_in_string_value(line: str) -> bool:
     """
     Check if the equals sign is inside a string value (quotes).
@@ -1957,71 +1812,203 @@ def _is_equals_in_string_value(line: str) -> bool:
     Returns:
         bool: True if the equals sign is inside a string value, False otherwise
     """
+    line_stripped = line.strip()
+    
+    # Only a line starting with a quote, or with the '=' itself (nothing before it), can match below
+    if line_stripped[:1] not in ('"', "'", '='):
+        return False
+    
     equals_pos = line.find('=')
     if equals_pos == -1:
         return False
     
-    line_stripped = line.strip()
-    
-    # List of comparison operators that might appear in string values
-    # These include: ==, !=, >=, <=, and variations
-    comparison_ops = ['==', '!=', '>=', '<=', '==', '!=', '>=', '<=']
-    
     # If the line starts with a quote and contains comparison operators, it's likely a string value
     # Examples: '"=="', '"!="', '">="', '"<="', '      "==",'
     if line_stripped.startswith('"'):
-        for op in comparison_ops:
-            if f'"{op}' in line or f'{op}"' in line:
-                return True
+        if any(substring in line for substring in _DOUBLE_QUOTED_COMPARISONS):
+            return True
     if line_stripped.startswith("'"):
-        for op in comparison_ops:
-            if f"'{op}" in line or f"{op}'" in line:
-                return True
+        if any(substring in line for substring in _SINGLE_QUOTED_COMPARISONS):
+            return True
     
     # Check if after equals starts with quote and contains comparison operators
     after_equals = line[equals_pos + 1:].strip()
     if after_equals.startswith('"'):
-        for op in comparison_ops:
-            if f'"{op}' in after_equals or f'{op}"' in after_equals:
-                # Check if before_equals is empty or just whitespace (meaning this is a value, not assignment)
-                before_equals = line[:equals_pos].strip()
-                if not before_equals or before_equals == '':
-                    return True
+        if any(substring in after_equals for substring in _DOUBLE_QUOTED_COMPARISONS):
+            # Check if before_equals is empty or just whitespace (meaning this is a value, not assignment)
+            if not line[:equals_pos].strip():
+                return True
     
     if after_equals.startswith("'"):
-        for op in comparison_ops:
-            if f"'{op}" in after_equals or f"{op}'" in after_equals:
-                before_equals = line[:equals_pos].strip()
-                if not before_equals or before_equals == '':
-                    return True
+        if any(substring in after_equals for substring in _SINGLE_QUOTED_COMPARISONS):
+            if not line[:equals_pos].strip():
+                return True
     
     return False
 
 
-def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
+class _TfvarsColumns(NamedTuple):
     """
-    Check parameter alignment in terraform.tfvars files.
+    Per-line columns of a tfvars file, indexed by line index (line number - 1).
+    """
+    stripped: List[str]
+    indents: List[int]
+    # Stripped line without trailing commas, compared against the boundary markers
+    boundary: List[str]
+    # First character of the value after the first '=', '' if the line has no '='
+    value_first_char: List[str]
+    # Prefix counts of blank lines: blank_counts[k] is the number of blank lines before line index k
+    blank_counts: List[int]
+
+    def has_blank_line_between(self, start_line_idx: int, end_line_idx: int) -> bool:
+        """
+        Check if there's a truly empty line strictly between two line indices (0-based),
+        answered from the blank line prefix counts.
+        """
+        end_line_idx = min(end_line_idx, len(self.stripped))
+        if start_line_idx + 1 >= end_line_idx:
+            return False
+        return self.blank_counts[end_line_idx] > self.blank_counts[start_line_idx + 1]
+
+
+class _TfvarsSection(list):
+    """
+    A tfvars section: a list of (line_num, line) entries that also keeps track of its
+    top-level parameters (an '=' line at indent 0), so that finding the last one does not
+    need to scan the section backwards.
+    """
+
+    def __init__(self, columns: _TfvarsColumns, entries=()):
+        super().__init__()
+        self.columns = columns
+        self.first_top_level_line_num: Optional[int] = None
+        self.last_top_level_line_num: Optional[int] = None
+        # Last top-level array declaration (param = [)
+        self.last_top_level_array_line_num: Optional[int] = None
+        # Whether a top-level ']' comes after the last top-level parameter
+        self.closes_top_level_array = False
+        # Last parameter at any level
+        self.last_param_line_num: Optional[int] = None
+        for entry in entries:
+            self.append(entry)
+
+    def append(self, entry: Tuple[int, str]) -> None:
+        super().append(entry)
+        line_num, line = entry
+        line_idx = line_num - 1
+        columns = self.columns
+        if '=' in line:
+            self.last_param_line_num = line_num
+            if columns.indents[line_idx] == 0:
+                if self.first_top_level_line_num is None:
+                    self.first_top_level_line_num = line_num
+                self.last_top_level_line_num = line_num
+                self.closes_top_level_array = False
+                if columns.value_first_char[line_idx] == '[':
+                    self.last_top_level_array_line_num = line_num
+        elif columns.boundary[line_idx] == ']' and columns.indents[line_idx] == 0:
+            self.closes_top_level_array = True
+
+    @property
+    def has_top_level_param(self) -> bool:
+        """Whether the section contains a top-level parameter."""
+        return self.last_top_level_line_num is not None
+
+    def extend(self, other: '_TfvarsSection') -> None:
+        super().extend(other)
+        if other.last_param_line_num is not None:
+            self.last_param_line_num = other.last_param_line_num
+        if other.last_top_level_line_num is not None:
+            if self.first_top_level_line_num is None:
+                self.first_top_level_line_num = other.first_top_level_line_num
+            self.last_top_level_line_num = other.last_top_level_line_num
+            self.closes_top_level_array = other.closes_top_level_array
+        elif other.closes_top_level_array:
+            self.closes_top_level_array = True
+        if other.last_top_level_array_line_num is not None:
+            self.last_top_level_array_line_num = other.last_top_level_array_line_num
+
+
+def _scan_tfvars_lines(lines: List[str]) -> _TfvarsColumns:
+    """
+    Compute the per-line columns of a tfvars file.
     
-    This function handles variable assignments in .tfvars files, which don't follow
-    the same block structure as .tf files. It groups consecutive variable assignments
-    and checks their alignment.
+    Args:
+        lines: File lines (comments removed)
+    
+    Returns:
+        _TfvarsColumns: Per-line columns indexed by line index
+    """
+    stripped_lines = [line.strip() for line in lines]
+    line_indents = [len(line) - len(line.lstrip()) for line in lines]
+    boundary_lines = [stripped.rstrip(',') for stripped in stripped_lines]
+    value_first_chars = [stripped[stripped.find('=') + 1:].lstrip()[:1] if '=' in stripped else ''
+                         for stripped in stripped_lines]
+    blank_counts = list(accumulate((not stripped for stripped in stripped_lines), initial=0))
+    return _TfvarsColumns(stripped_lines, line_indents, boundary_lines, value_first_chars, blank_counts)
+
+
+def _split_flat_tfvars_sections(lines: List[str], columns: _TfvarsColumns) -> List[_TfvarsSection]:
+    """
+    Split a flat tfvars file, where every assignment is at indent 0 and there are no braces,
+    brackets or heredocs, into sections of assignments separated by blank lines.
+    
+    This gives the same sections as _group_tfvars_sections for such files.
     
     Args:
-        file_path (str): Path to the file being checked
-        content (str): Cleaned file content (comments removed)
-        log_error_func (Callable): Error logging function
+        lines: File lines (comments removed)
+        columns: Per-line columns of the file
+    
+    Returns:
+        List[_TfvarsSection]: Sections in line order
     """
-    lines = content.split('\n')
+    sections = []
+    current_section = _TfvarsSection(columns)
+    for i, stripped in enumerate(columns.stripped):
+        if '=' in stripped:
+            current_section.append((i + 1, lines[i]))
+        elif not stripped and current_section:
+            sections.append(current_section)
+            current_section = _TfvarsSection(columns)
+    if current_section:
+        sections.append(current_section)
+    return sections
+
+
+def _group_tfvars_sections(lines: List[str], columns: _TfvarsColumns) -> List[_TfvarsSection]:
+    """
+    Group the variable assignment lines of a tfvars file into alignment sections.
+    
+    Assignments are grouped by structural boundaries (arrays and objects) and blank lines,
+    heredoc content is skipped.
+    
+    Args:
+        lines: File lines (comments removed)
+        columns: Per-line columns of the file
+    
+    Returns:
+        List[_TfvarsSection]: Sections of (line_num, line) entries
+    """
+    stripped_lines = columns.stripped
+    line_indents = columns.indents
+    boundary_lines = columns.boundary
+    value_first_chars = columns.value_first_char
     
     # Track heredoc state to skip content inside heredoc blocks
     in_heredoc = False
     heredoc_terminator = None
     
-    # Find all variable assignment lines and boundary markers
-    assignment_lines = []
+    # Group variable assignment lines and boundary markers by structural boundaries as they are found
+    # This handles nested structures like arrays and objects in tfvars files
+    sections = []
+    current_section = _TfvarsSection(columns)
+    brace_level = 0
+    bracket_level = 0
+    top_level_indent = 0  # Track the indent of the current top-level section
+    
     for i, line in enumerate(lines):
         # Check heredoc state
-        line_stripped = line.strip()
+        line_stripped = stripped_lines[i]
         
         # Check for heredoc end pattern first (before checking start)
         # The terminator must be at the beginning of the line (after stripping)
@@ -2038,42 +2025,20 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         # Check for heredoc start pattern (<<EOF, <<-EOF, etc.)
         # This must be checked AFTER we've processed the line (if it contains '=' or boundary markers)
         # Match <<EOF or <<-EOF at the end of a line
-        heredoc_match = re.search(r'<<-?([A-Z]+)\s*$', line)
+        heredoc_match = HEREDOC_RE.search(line) if '<<' in line else None
         if heredoc_match:
             in_heredoc = True
             heredoc_terminator = heredoc_match.group(1)
             # Continue to process the heredoc start line if it contains '=' or boundary markers
         
-        stripped = line_stripped
-        if stripped and '=' in stripped:
-            # Include all assignment lines (comments already removed)
-            assignment_lines.append((i + 1, line))
-        elif stripped.rstrip(',') in ['{', '}', '[', ']']:
-            # Include brace and bracket lines as boundary markers (allow trailing commas)
-            assignment_lines.append((i + 1, line))
-    
-    if not assignment_lines:
-        return
-    
-    # Group assignment lines by structural boundaries
-    # This handles nested structures like arrays and objects in tfvars files
-    sections = []
-    current_section = []
-    brace_level = 0
-    bracket_level = 0
-    top_level_indent = 0  # Track the indent of the current top-level section
-    
-    # Helper function to check if a section contains top-level parameters
-    def _section_has_top_level_param(sec):
-        for _ln, _l in sec:
-            if '=' in _l and (len(_l) - len(_l.lstrip())) == 0:
-                return True
-        return False
-    
-    for idx, (line_num, line) in enumerate(assignment_lines):
-        stripped_line = line.strip()
+        # Only variable assignment lines (comments already removed) and brace and bracket lines
+        # as boundary markers (allow trailing commas) are grouped
+        if not (line_stripped and '=' in line_stripped) and boundary_lines[i] not in _BOUNDARY_MARKERS:
+            continue
+        line_num = i + 1
+        stripped_line = line_stripped
         # Also strip trailing comma for boundary checks
-        stripped_for_boundary = stripped_line.rstrip(',')
+        stripped_for_boundary = boundary_lines[i]
         
         # Save levels BEFORE updating them
         prev_brace_level_saved = brace_level
@@ -2081,22 +2046,30 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         
         # Track brace and bracket levels to detect nested structures
         # Ensure levels don't go negative (defensive programming)
-        for char in stripped_line:
-            if char == '{':
-                brace_level += 1
-            elif char == '}':
-                brace_level = max(0, brace_level - 1)
-            elif char == '[':
-                bracket_level += 1
-            elif char == ']':
-                bracket_level = max(0, bracket_level - 1)
+        # A level can only be clamped when the line closes more than the current level,
+        # otherwise counting the characters gives the same result as walking them
+        close_braces = stripped_line.count('}')
+        close_brackets = stripped_line.count(']')
+        if close_braces <= brace_level and close_brackets <= bracket_level:
+            brace_level += stripped_line.count('{') - close_braces
+            bracket_level += stripped_line.count('[') - close_brackets
+        else:
+            for char in stripped_line:
+                if char == '{':
+                    brace_level += 1
+                elif char == '}':
+                    brace_level = max(0, brace_level - 1)
+                elif char == '[':
+                    bracket_level += 1
+                elif char == ']':
+                    bracket_level = max(0, bracket_level - 1)
         
         # Check if we're entering an array (line ends with [)
         if stripped_line.endswith('[') and bracket_level == 1 and '=' in stripped_line:
-            after_equals = stripped_line.split('=', 1)[1].strip()
+            after_equals = stripped_line[stripped_line.find('=') + 1:].lstrip()
             if after_equals == '[':
                 # Array declaration line - check if we should split based on blank lines
-                line_indent = len(line) - len(line.lstrip())
+                line_indent = line_indents[i]
                 prev_brace_level = prev_brace_level_saved
                 prev_bracket_level = prev_bracket_level_saved
                 
@@ -2116,11 +2089,11 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         # Check if we're entering an object (parameter = {)
         # But only if it's NOT a top-level parameter (top-level should be aligned first)
         if stripped_line.endswith('{') and '=' in stripped_line:
-            after_equals = stripped_line.split('=', 1)[1].strip()
+            after_equals = stripped_line[stripped_line.find('=') + 1:].lstrip()
             if after_equals == '{':
                 # Check if this is a top-level parameter
                 # We need to use levels BEFORE this line updates them
-                line_indent = len(line) - len(line.lstrip())
+                line_indent = line_indents[i]
                 prev_brace_level = prev_brace_level_saved
                 prev_bracket_level = prev_bracket_level_saved
                 
@@ -2152,9 +2125,9 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         # Split sections when encountering a standalone '{' inside any array level
         if bracket_level >= 1 and stripped_for_boundary == '{' and '=' not in stripped_line:
             # Only split if current_section is not tracking top-level parameters
-            if current_section and not _section_has_top_level_param(current_section):
+            if current_section and not current_section.has_top_level_param:
                 sections.append(current_section)
-                current_section = []
+                current_section = _TfvarsSection(columns)
         
         # When exiting an array at top level, ensure subsequent top-level params join the same section
         # This handles cases like: rule_conditions = [...] followed by approval_content = ...
@@ -2166,9 +2139,9 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
             # Check if we need to merge sections to ensure subsequent top-level params can join
             # The key insight: when a top-level array closes, we want subsequent top-level params
             # to be in the same section as the array declaration, so they can align together
-            if len(sections) > 0:
-                prev_section = sections[-1] if sections else None
-                if prev_section and _section_has_top_level_param(prev_section):
+            if sections:
+                prev_section = sections[-1]
+                if prev_section.has_top_level_param:
                     # Previous section has top-level params (like rule_conditions = [)
                     # Merge current_section with prev_section so subsequent top-level params can join
                     sections.pop()
@@ -2177,14 +2150,14 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
                         prev_section.extend(current_section)
                     # Set current_section to prev_section so subsequent top-level params join it
                     current_section = prev_section
-            elif current_section and _section_has_top_level_param(current_section):
+            elif current_section and current_section.has_top_level_param:
                 # current_section already has top-level params, no need to merge
                 # This handles the case where the array content didn't cause section splitting
                 pass
-            elif not current_section and len(sections) > 0:
+            elif not current_section and sections:
                 # current_section is empty, check if we should restore from previous section
-                prev_section = sections[-1] if sections else None
-                if prev_section and _section_has_top_level_param(prev_section):
+                prev_section = sections[-1]
+                if prev_section.has_top_level_param:
                     sections.pop()
                     current_section = prev_section
             # If current_section doesn't have top-level params and there's no previous section with top-level params,
@@ -2193,7 +2166,7 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         # Regular grouping logic (handles gaps between lines)
         # Check if we should process this line for regular grouping
         process_regular_grouping = True
-        is_boundary_marker = stripped_for_boundary in ['{', '}', '[', ']'] and '=' not in stripped_line
+        is_boundary_marker = stripped_for_boundary in _BOUNDARY_MARKERS and '=' not in stripped_line
         if is_boundary_marker:
             # Standalone braces/brackets are handled above, skip regular grouping
             process_regular_grouping = False
@@ -2201,16 +2174,16 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
             # Especially important for array closing brackets that affect section grouping
             if current_section:
                 current_section.append((line_num, line))
-            elif not current_section and len(sections) > 0:
+            elif sections:
                 # If current_section is empty, add to the last section
                 sections[-1].append((line_num, line))
             else:
                 # No current_section and no sections, create a new one
-                current_section = [(line_num, line)]
+                current_section = _TfvarsSection(columns, [(line_num, line)])
         
         if process_regular_grouping:
             # Calculate current line's indent
-            line_indent = len(line) - len(line.lstrip())
+            line_indent = line_indents[i]
             
             if not current_section:
                 # First line
@@ -2243,41 +2216,18 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
                 if is_top_level or is_object_param:
                     # This is another top-level parameter, array object parameter, or object parameter
                     # Find the previous parameter at the same level (top-level for top-level, nested for nested)
-                    prev_line_num = None
-                    for prev_ln, prev_l in reversed(current_section):
-                        prev_stripped = prev_l.strip()
-                        prev_stripped_boundary = prev_stripped.rstrip(',')
-                        # Skip pure boundary markers (lines that are only ], }, [, or {)
-                        # But include parameter declarations like "param = [" or "param = {"
-                        if '=' in prev_l:
-                            # This is a parameter declaration
-                            # For top-level parameters, only use previous top-level parameters
-                            # For nested parameters, use any previous parameter
-                            if is_top_level:
-                                prev_indent = len(prev_l) - len(prev_l.lstrip())
-                                if prev_indent == 0:
-                                    # Previous parameter is also top-level, use it
-                                    prev_line_num = prev_ln
-                                    break
-                            else:
-                                # For nested parameters, use any previous parameter
-                                prev_line_num = prev_ln
-                                break
-                        elif prev_stripped_boundary not in ['{', '}', '[', ']']:
-                            # Not a boundary marker, but also not a parameter - skip
-                            continue
+                    # Boundary markers are skipped, parameter declarations like "param = [" or "param = {" count
+                    # For top-level parameters, only use previous top-level parameters
+                    # For nested parameters, use any previous parameter
+                    if is_top_level:
+                        prev_line_num = current_section.last_top_level_line_num
+                    else:
+                        prev_line_num = current_section.last_param_line_num
                     
                     # If no previous parameter found at same level, check previous section for top-level params
-                    if prev_line_num is None and is_top_level and len(sections) > 0:
+                    if prev_line_num is None and is_top_level and sections:
                         # Look for last top-level param in previous section
-                        prev_section = sections[-1] if sections else None
-                        if prev_section:
-                            for prev_ln, prev_l in reversed(prev_section):
-                                if '=' in prev_l:
-                                    prev_indent = len(prev_l) - len(prev_l.lstrip())
-                                    if prev_indent == 0:
-                                        prev_line_num = prev_ln
-                                        break
+                        prev_line_num = sections[-1].last_top_level_line_num
                     
                     # If still no previous parameter found, use the last line in section
                     if prev_line_num is None and current_section:
@@ -2285,7 +2235,7 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
                     
                     has_gap = False
                     if prev_line_num is not None:
-                        has_gap = _has_blank_line_between(lines, prev_line_num - 1, line_num - 1)
+                        has_gap = columns.has_blank_line_between(prev_line_num - 1, line_num - 1)
                     
                     # For tfvars, split on blank lines unless they're inside arrays/objects
                     # If there's a blank line and we're both at the top level, always split
@@ -2293,7 +2243,7 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
                         # Both are top-level parameters separated by a blank line
                         # Split into separate sections
                         sections.append(current_section)
-                        current_section = [(line_num, line)]
+                        current_section = _TfvarsSection(columns, [(line_num, line)])
                         
                     else:
                         # If current_section tracks top-level params, and this line is an object param
@@ -2302,51 +2252,15 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
                         # we should return to the previous section with top-level params (if it exists)
                         # BUT only if there's no blank line between the previous section and current line
                         # Otherwise, if this is a nested param and current section has top-level params, split for nested params
-                        if is_top_level and not _section_has_top_level_param(current_section) and len(sections) > 0:
+                        if is_top_level and not current_section.has_top_level_param and sections:
                             # Current line is top-level param, but current section only has nested params
                             # Check if previous section has top-level params - if so, check for blank line before merging
-                            prev_section = sections[-1] if sections else None
-                            if prev_section and _section_has_top_level_param(prev_section):
-                                # Find the last top-level parameter in previous section
-                                # Also check for array/object declarations that might be the last top-level element
-                                last_top_level_line_num = None
-                                # First, try to find the last top-level param in prev_section
-                                for prev_ln, prev_l in reversed(prev_section):
-                                    if '=' in prev_l:
-                                        prev_indent = len(prev_l) - len(prev_l.lstrip())
-                                        if prev_indent == 0:
-                                            last_top_level_line_num = prev_ln
-                                            break
-                                
-                                # If we still haven't found a top-level param, check the current_section
-                                # for array closing brackets that might help us find the last top-level param
-                                if last_top_level_line_num is None:
-                                    for prev_ln, prev_l in reversed(current_section):
-                                        if prev_l.strip().rstrip(',') == ']' and len(prev_l) - len(prev_l.lstrip()) == 0:
-                                            # This is a top-level array closing in current_section
-                                            # The array declaration should be in prev_section
-                                            for prev_ln2, prev_l2 in reversed(prev_section):
-                                                if '=' in prev_l2 and (len(prev_l2) - len(prev_l2.lstrip())) == 0:
-                                                    equals_pos = prev_l2.find('=')
-                                                    after_equals = prev_l2[equals_pos + 1:].strip()
-                                                    if after_equals.startswith('['):
-                                                        last_top_level_line_num = prev_ln2
-                                                        break
-                                            if last_top_level_line_num:
-                                                break
-                                
-                                # If still not found, just use the last top-level param in prev_section
-                                # This handles cases where the array closing bracket logic didn't work
-                                if last_top_level_line_num is None:
-                                    for prev_ln, prev_l in reversed(prev_section):
-                                        if '=' in prev_l and (len(prev_l) - len(prev_l.lstrip())) == 0:
-                                            last_top_level_line_num = prev_ln
-                                            break
-                                
-                                # Check if there's a blank line between last top-level param and current line
-                                has_blank_line = False
-                                if last_top_level_line_num is not None:
-                                    has_blank_line = _has_blank_line_between(lines, last_top_level_line_num - 1, line_num - 1)
+                            prev_section = sections[-1]
+                            if prev_section.has_top_level_param:
+                                # Check if there's a blank line between the last top-level param in
+                                # previous section and current line
+                                last_top_level_line_num = prev_section.last_top_level_line_num
+                                has_blank_line = columns.has_blank_line_between(last_top_level_line_num - 1, line_num - 1)
                                 
                                 if not has_blank_line:
                                     # No blank line - merge previous section with current_section and add this line
@@ -2361,60 +2275,48 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
                                     # Blank line separates - start new section
                                     if current_section:
                                         sections.append(current_section)
-                                    current_section = [(line_num, line)]
+                                    current_section = _TfvarsSection(columns, [(line_num, line)])
                             else:
                                 # No previous section with top-level params, start new section
                                 if current_section:
                                     sections.append(current_section)
-                                current_section = [(line_num, line)]
-                        elif is_top_level and _section_has_top_level_param(current_section):
+                                current_section = _TfvarsSection(columns, [(line_num, line)])
+                        elif is_top_level and current_section.has_top_level_param:
                             # Current line is top-level param and current section has top-level params
                             # Check for blank line to decide if we should split
-                            prev_line_num = None
-                            for prev_ln, prev_l in reversed(current_section):
-                                if '=' in prev_l and (len(prev_l) - len(prev_l.lstrip())) == 0:
-                                    prev_line_num = prev_ln
-                                    break
-                                # Also check for array closing brackets at top level
-                                elif prev_l.strip().rstrip(',') == ']' and len(prev_l) - len(prev_l.lstrip()) == 0:
-                                    # This is a top-level array closing - find the array declaration before it
-                                    for prev_ln2, prev_l2 in reversed(current_section):
-                                        if '=' in prev_l2 and (len(prev_l2) - len(prev_l2.lstrip())) == 0:
-                                            equals_pos = prev_l2.find('=')
-                                            after_equals = prev_l2[equals_pos + 1:].strip()
-                                            if after_equals.startswith('['):
-                                                prev_line_num = prev_ln2
-                                                break
-                                    if prev_line_num:
-                                        break
+                            # If a top-level array closes after the last top-level param, use the array declaration
+                            prev_line_num = current_section.last_top_level_line_num
+                            if (current_section.closes_top_level_array and
+                                    current_section.last_top_level_array_line_num is not None):
+                                prev_line_num = current_section.last_top_level_array_line_num
                             
                             has_gap = False
                             if prev_line_num is not None:
-                                has_gap = _has_blank_line_between(lines, prev_line_num - 1, line_num - 1)
+                                has_gap = columns.has_blank_line_between(prev_line_num - 1, line_num - 1)
                             
                             if has_gap and prev_brace_level == 0 and prev_bracket_level == 0:
                                 # Both are top-level parameters separated by a blank line
                                 # Split into separate sections
                                 sections.append(current_section)
-                                current_section = [(line_num, line)]
+                                current_section = _TfvarsSection(columns, [(line_num, line)])
                             else:
                                 # Same group, add to current section
                                 current_section.append((line_num, line))
-                        elif is_object_param and _section_has_top_level_param(current_section) and not is_top_level:
+                        elif is_object_param and current_section.has_top_level_param and not is_top_level:
                             # Current line is object param (nested), and section has top-level params - split for nested params
                             sections.append(current_section)
-                            current_section = [(line_num, line)]
+                            current_section = _TfvarsSection(columns, [(line_num, line)])
                         else:
                             # Same group, add to current section
                             current_section.append((line_num, line))
                 else:
                     # Not a top-level parameter, check gap from previous line
                     prev_line_num = current_section[-1][0]
-                    has_gap = _has_blank_line_between(lines, prev_line_num - 1, line_num - 1)
+                    has_gap = columns.has_blank_line_between(prev_line_num - 1, line_num - 1)
                     if has_gap:
                         # Blank line separates sections
                         sections.append(current_section)
-                        current_section = [(line_num, line)]
+                        current_section = _TfvarsSection(columns, [(line_num, line)])
                     else:
                         # Same line group, add to current section
                         current_section.append((line_num, line))
@@ -2435,51 +2337,60 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
             merged_sections.append(section)
             continue
         
-        prev_section = merged_sections[-1] if merged_sections else None
-        if prev_section and _section_has_top_level_param(prev_section):
+        prev_section = merged_sections[-1]
+        if prev_section.has_top_level_param:
             # Find the last top-level param in prev_section
-            last_top_level_line_num = None
-            last_top_level_line = None
-            for prev_ln, prev_l in reversed(prev_section):
-                if '=' in prev_l and (len(prev_l) - len(prev_l.lstrip())) == 0:
-                    last_top_level_line_num = prev_ln
-                    last_top_level_line = prev_l
-                    break
+            last_top_level_line_num = prev_section.last_top_level_line_num
             
             # Check if the last top-level param is an array/object declaration
             # Only merge if it's an array/object declaration (ends with [ or {)
-            is_array_or_object_decl = False
-            if last_top_level_line is not None:
-                equals_pos = last_top_level_line.find('=')
-                if equals_pos != -1:
-                    after_equals = last_top_level_line[equals_pos + 1:].strip()
-                    is_array_or_object_decl = after_equals.startswith('[') or after_equals.startswith('{')
-            
-            # Find the first top-level param in current section
-            # Only merge if current section also has top-level params
-            first_top_level_line_num = None
-            current_section_has_top_level = False
-            for curr_ln, curr_l in section:
-                if '=' in curr_l and (len(curr_l) - len(curr_l.lstrip())) == 0:
-                    current_section_has_top_level = True
-                    if first_top_level_line_num is None:
-                        first_top_level_line_num = curr_ln
-                    break
+            is_array_or_object_decl = value_first_chars[last_top_level_line_num - 1] in ('[', '{')
             
             # Only merge if:
             # 1. The last top-level param in prev_section is an array/object declaration
             # 2. Current section also has top-level params (not just nested params)
             # 3. There's no blank line between them
-            if is_array_or_object_decl and last_top_level_line_num is not None and first_top_level_line_num is not None and current_section_has_top_level:
-                has_blank_line = _has_blank_line_between(lines, last_top_level_line_num - 1, first_top_level_line_num - 1)
+            if is_array_or_object_decl and section.has_top_level_param:
+                has_blank_line = columns.has_blank_line_between(last_top_level_line_num - 1, section.first_top_level_line_num - 1)
                 if not has_blank_line:
                     # Merge sections
-                    merged_sections[-1].extend(section)
+                    prev_section.extend(section)
                     continue
         
         merged_sections.append(section)
     
-    sections = merged_sections
+    return merged_sections
+
+
+def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
+    """
+    Check parameter alignment in terraform.tfvars files.
+    
+    This function handles variable assignments in .tfvars files, which don't follow
+    the same block structure as .tf files. It groups consecutive variable assignments
+    and checks their alignment.
+    
+    Args:
+        file_path (str): Path to the file being checked
+        content (str): Cleaned file content (comments removed)
+        log_error_func (Callable): Error logging function
+    """
+    lines = content.split('\n')
+    
+    # Per-line metadata, computed once so that the backward searches over sections while grouping
+    # are plain index lookups (section entries are (line_num, line), i.e. index line_num - 1)
+    columns = _scan_tfvars_lines(lines)
+    stripped_lines = columns.stripped
+    line_indents = columns.indents
+    value_first_chars = columns.value_first_char
+    
+    # A flat file (every assignment at indent 0, no braces, brackets or heredocs) has no nesting to
+    # track, so its sections are simply the runs of assignments between blank lines
+    if (not any(marker in content for marker in ('{', '}', '[', ']', '<<')) and
+            all(line_indents[i] == 0 for i, stripped in enumerate(stripped_lines) if '=' in stripped)):
+        sections = _split_flat_tfvars_sections(lines, columns)
+    else:
+        sections = _group_tfvars_sections(lines, columns)
     
     # Check alignment in each section
     all_errors = []
@@ -2502,8 +2413,8 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         # Build groups quickly to detect counts
         temp_params = []
         for line, actual_line_num in converted_section:
-            if '=' in line and not line.strip().startswith('#'):
-                indent = len(line) - len(line.lstrip())
+            if '=' in line and not stripped_lines[actual_line_num - 1].startswith('#'):
+                indent = line_indents[actual_line_num - 1]
                 indent_level = indent // 2
                 temp_params.append((indent_level, actual_line_num, line))
         top_level_params = [(n, l) for il, n, l in temp_params if il == 0]
@@ -2511,7 +2422,7 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         if len(top_level_params) >= 2:
             # Recompute expected for this section's top-level group
             group_lines = [(n, l) for n, l in top_level_params]
-            last_top_level_expected = _compute_expected_equals_location_tfvars(group_lines, 0)
+            last_top_level_expected = _compute_expected_equals_location_tfvars(group_lines, 0, columns)
             last_top_level_group_size = len(top_level_params)
             last_multi_param_section_idx = section_idx
         elif len(top_level_params) == 1 and last_top_level_expected is not None:
@@ -2535,15 +2446,12 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
                     for check_line_num, check_line in check_section:
                         if check_line_num > last_multi_param_last_line_num and check_line_num < current_first_line_num:
                             if '=' in check_line:
-                                check_indent = len(check_line) - len(check_line.lstrip())
-                                if check_indent == 0 and not check_line.strip().startswith('#'):
+                                check_indent = line_indents[check_line_num - 1]
+                                if check_indent == 0 and not stripped_lines[check_line_num - 1].startswith('#'):
                                     # Check if this is an object declaration (param = {), not array (param = [)
-                                    check_equals_pos = check_line.find('=')
-                                    if check_equals_pos != -1:
-                                        check_after_equals = check_line[check_equals_pos + 1:].strip()
-                                        if check_after_equals.startswith('{'):
-                                            has_other_top_level_object_decls = True
-                                            break
+                                    if value_first_chars[check_line_num - 1] == '{':
+                                        has_other_top_level_object_decls = True
+                                        break
                     if has_other_top_level_object_decls:
                         break
                 
@@ -2554,8 +2462,8 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
                     last_top_level_param_line_num = None
                     for check_line_num, check_line in reversed(last_multi_param_section):
                         if '=' in check_line:
-                            check_indent = len(check_line) - len(check_line.lstrip())
-                            if check_indent == 0 and not check_line.strip().startswith('#'):
+                            check_indent = line_indents[check_line_num - 1]
+                            if check_indent == 0 and not stripped_lines[check_line_num - 1].startswith('#'):
                                 last_top_level_param_line_num = check_line_num
                                 break
                     
@@ -2563,20 +2471,20 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
                     current_first_top_level_param_line_num = None
                     for check_line_num, check_line in section:
                         if '=' in check_line:
-                            check_indent = len(check_line) - len(check_line.lstrip())
-                            if check_indent == 0 and not check_line.strip().startswith('#'):
+                            check_indent = line_indents[check_line_num - 1]
+                            if check_indent == 0 and not stripped_lines[check_line_num - 1].startswith('#'):
                                 current_first_top_level_param_line_num = check_line_num
                                 break
                     
                     # Check if there's a blank line between them
                     if last_top_level_param_line_num is not None and current_first_top_level_param_line_num is not None:
-                        has_blank_line_between_sections = _has_blank_line_between(lines, last_top_level_param_line_num - 1, current_first_top_level_param_line_num - 1)
+                        has_blank_line_between_sections = columns.has_blank_line_between(last_top_level_param_line_num - 1, current_first_top_level_param_line_num - 1)
                 
                 if not has_other_top_level_object_decls and not has_blank_line_between_sections:
                     top_level_override = last_top_level_expected
             # Don't update last_top_level_group_size here - preserve it for subsequent sections
 
-        errors = _check_tfvars_parameter_alignment_in_section(converted_section, "tfvars", top_level_expected_override=top_level_override, original_lines=lines)
+        errors = _check_tfvars_parameter_alignment_in_section(converted_section, "tfvars", columns, top_level_expected_override=top_level_override, original_lines=lines)
         
         # Only add errors for lines that haven't been processed yet
         for line_num, msg in errors:
@@ -2592,7 +2500,7 @@ def _check_tfvars_parameter_alignment(file_path: str, content: str, log_error_fu
         log_error_func(file_path, "ST.003", error_msg, line_num)
 
 
-def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]], block_type: str, top_level_expected_override: Optional[int] = None, original_lines: Optional[List[str]] = None) -> List[Tuple[int, str]]:
+def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]], block_type: str, columns: _TfvarsColumns, top_level_expected_override: Optional[int] = None, original_lines: Optional[List[str]] = None) -> List[Tuple[int, str]]:
     """
     Check parameter alignment in a tfvars section.
     
@@ -2601,6 +2509,7 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
     Args:
         section: List of (line_content, actual_line_num) tuples
         block_type: Type of the block being checked
+        columns: Per-line columns of the tfvars file
     
     Returns:
         List[Tuple[int, str]]: List of (line_number, error_message) tuples
@@ -2611,9 +2520,10 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
     # Extract parameter lines from section
     for line_content, actual_line_num in section:
         line = line_content.rstrip()
-        if '=' in line and not line.strip().startswith('#'):
+        line_stripped = line.strip()
+        if '=' in line and not line_stripped.startswith('#'):
             # Skip block declarations
-            if not re.match(r'^\s*(data|resource|variable|output|locals|module)\s+', line):
+            if not (line_stripped.startswith(BLOCK_DECL_KEYWORDS) and BLOCK_DECL_RE.match(line)):
                 # Skip lines where equals sign is inside a string value (e.g., "==", "!=")
                 if _is_equals_in_string_value(line):
                     continue
@@ -2629,9 +2539,15 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
     current_groups = {}  # Track current group for each indent level
     prev_line_num = None
     
+    # Line number of the latest parameter seen at each indent level (odd indents included),
+    # so the previous parameter at the same level is a lookup rather than a backward scan
+    last_line_num_by_level = {}
+    
     for line, actual_line_num in parameter_lines:
         indent = len(line) - len(line.lstrip())
         indent_level = indent // 2
+        prev_same_level_line_num = last_line_num_by_level.get(indent_level)
+        last_line_num_by_level[indent_level] = actual_line_num
         # Skip odd indent (indent not multiple of 2) - these are ST.005 issues
         if indent % 2 != 0:
             continue
@@ -2641,25 +2557,8 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
         # Only check for blank lines if the previous parameter has the same indent level
         # This ensures that parameters at different indent levels don't affect each other's grouping
         if prev_line_num is not None and original_lines is not None:
-            # Find the previous parameter with the same indent level
-            prev_same_level_line_num = None
-            # Find the index of current parameter in parameter_lines
-            current_idx = None
-            for idx, (pl_line, pl_line_num) in enumerate(parameter_lines):
-                if pl_line_num == actual_line_num and pl_line == line:
-                    current_idx = idx
-                    break
-            
-            if current_idx is not None:
-                for prev_line, prev_actual_line_num in reversed(parameter_lines[:current_idx]):
-                    prev_indent = len(prev_line) - len(prev_line.lstrip())
-                    prev_indent_level = prev_indent // 2
-                    if prev_indent_level == indent_level:
-                        prev_same_level_line_num = prev_actual_line_num
-                        break
-            
             if prev_same_level_line_num is not None:
-                has_gap = _has_blank_line_between(original_lines, prev_same_level_line_num - 1, actual_line_num - 1)
+                has_gap = columns.has_blank_line_between(prev_same_level_line_num - 1, actual_line_num - 1)
                 
                 # For nested parameters (indent_level > 0), also check for structural boundaries
                 # Parameters in different objects (separated by } and {) should be in different groups
@@ -2667,23 +2566,23 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
                 if indent_level > 0 and original_lines is not None:
                     # Check if there's a closing brace followed by an opening brace between the two parameters
                     # This indicates they're in different objects
+                    boundary_lines = columns.boundary
+                    value_first_chars = columns.value_first_char
                     for check_line_idx in range(prev_same_level_line_num - 1, actual_line_num - 1):
-                        if check_line_idx < len(original_lines):
-                            check_line_raw = original_lines[check_line_idx]
-                            check_line = check_line_raw.strip().rstrip(',')
+                        if check_line_idx < len(boundary_lines):
+                            check_line = boundary_lines[check_line_idx]
                             # Skip comment lines
                             if check_line.startswith('#'):
                                 continue
                             # Check for closing brace at same or higher indent level
                             if check_line == '}':
-                                check_indent = len(check_line_raw) - len(check_line_raw.lstrip())
+                                check_indent = columns.indents[check_line_idx]
                                 # If the closing brace is at a lower indent level than our parameters, it's a boundary
                                 if check_indent < indent:
                                     # Look for an opening brace or object declaration after this closing brace
                                     for next_line_idx in range(check_line_idx + 1, actual_line_num - 1):
-                                        if next_line_idx < len(original_lines):
-                                            next_line_raw = original_lines[next_line_idx]
-                                            next_line = next_line_raw.strip().rstrip(',')
+                                        if next_line_idx < len(boundary_lines):
+                                            next_line = boundary_lines[next_line_idx]
                                             # Skip comment lines
                                             if next_line.startswith('#'):
                                                 continue
@@ -2692,12 +2591,10 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
                                                 has_structural_boundary = True
                                                 break
                                             # Check for object declaration (param = {)
-                                            if '=' in next_line:
-                                                equals_pos = next_line.find('=')
-                                                after_equals = next_line[equals_pos + 1:].strip()
-                                                if after_equals.startswith('{'):
-                                                    has_structural_boundary = True
-                                                    break
+                                            # (a trailing comma never hides the first character of the value)
+                                            if value_first_chars[next_line_idx] == '{':
+                                                has_structural_boundary = True
+                                                break
                                     if has_structural_boundary:
                                         break
                 
@@ -2738,12 +2635,12 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
                 display_line = line.expandtabs(2)
                 equals_pos = display_line.find('=')
                 # Only apply override for top-level object declarations (param = {), not arrays
-                after_equals_strip = display_line[equals_pos + 1:].strip() if equals_pos != -1 else ''
-                if equals_pos != -1 and after_equals_strip.startswith('{') and '\t' not in line and equals_pos != top_level_expected_override:
+                # (expanding tabs does not change the first character of the value)
+                if equals_pos != -1 and columns.value_first_char[actual_line_num - 1] == '{' and '\t' not in line and equals_pos != top_level_expected_override:
                     # Compute param display length with quotes if any for message spacing
                     before_equals = display_line[:equals_pos]
-                    if before_equals.strip().startswith('"') or before_equals.strip().startswith("'"):
-                        name_match = re.match(r"^\s*([\"\'])([^\"'\s=]+)\1", before_equals)
+                    if before_equals.strip().startswith(('"', "'")):
+                        name_match = _QUOTED_PARAM_NAME_RE.match(before_equals)
                         param_name = name_match.group(2) if name_match else before_equals.strip().strip("\"'")
                         name_len = len(param_name) + 2
                     else:
@@ -2775,7 +2672,7 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
                 errors.extend(spacing_errors)
                 # Don't continue here - let it fall through to normal alignment check
 
-            alignment_errors = _check_group_alignment_tfvars(group_lines, indent_level, block_type)
+            alignment_errors = _check_group_alignment_tfvars(group_lines, indent_level, block_type, columns)
             errors.extend(alignment_errors)
             
             # Check spacing for each line in the group
@@ -2786,7 +2683,7 @@ def _check_tfvars_parameter_alignment_in_section(section: List[Tuple[str, int]],
     return errors
 
 
-def _compute_expected_equals_location_tfvars(group_lines: List[Tuple[int, str]], indent_level: int) -> Optional[int]:
+def _compute_expected_equals_location_tfvars(group_lines: List[Tuple[int, str]], indent_level: int, columns: _TfvarsColumns) -> Optional[int]:
     """Compute expected equals location for a tfvars group similarly to _check_group_alignment_tfvars."""
     # Reuse the same param_data building logic
     param_data = []
@@ -2798,15 +2695,14 @@ def _compute_expected_equals_location_tfvars(group_lines: List[Tuple[int, str]],
         before_equals = display_line[:equals_pos]
         if before_equals.strip().startswith('[') or (before_equals.strip() == '' and line.strip().startswith('[')):
             continue
-        after_equals = display_line[equals_pos + 1:].strip()
-        is_object_or_array_decl = after_equals.startswith('[') or after_equals.startswith('{')
+        is_object_or_array_decl = columns.value_first_char[actual_line_num - 1] in ('[', '{')
         actual_indent = len(line) - len(line.lstrip())
         should_skip_from_expected_calc = is_object_or_array_decl and actual_indent > 0
-        if before_equals.strip().startswith('"') or before_equals.strip().startswith("'"):
-            m = re.match(r"^\s*([\"\'])([^\"'\s=]+)\1", before_equals)
+        if before_equals.strip().startswith(('"', "'")):
+            m = _QUOTED_PARAM_NAME_RE.match(before_equals)
             param_name = m.group(2) if m else None
         else:
-            m = re.match(r"^\s*([^\"'\s=]+)", before_equals)
+            m = _BARE_PARAM_NAME_RE.match(before_equals)
             param_name = m.group(1) if m else None
         if param_name is not None:
             param_data.append((param_name, line, actual_line_num, equals_pos, should_skip_from_expected_calc))
@@ -2828,12 +2724,12 @@ def _compute_expected_equals_location_tfvars(group_lines: List[Tuple[int, str]],
             longest_param_len = max(len(p[0]) for p in non_tab_params)
         else:
             longest_param_len = max(len(p[0]) for p in param_data)
-    has_quoted_params = any(line[:line.find('=')].strip().startswith('"') or line[:line.find('=')].strip().startswith("'") for _, line, _, _, _ in param_data)
+    has_quoted_params = any(line[:line.find('=')].strip().startswith(('"', "'")) for _, line, _, _, _ in param_data)
     quote_chars = 2 if has_quoted_params else 0
     return indent_spaces + longest_param_len + quote_chars + 1
 
 
-def _check_group_alignment_tfvars(group_lines: List[Tuple[int, str]], indent_level: int, block_type: str) -> List[Tuple[int, str]]:
+def _check_group_alignment_tfvars(group_lines: List[Tuple[int, str]], indent_level: int, block_type: str, columns: _TfvarsColumns) -> List[Tuple[int, str]]:
     """Check alignment within a group of tfvars parameters, using actual line numbers."""
     errors = []
     
@@ -2866,8 +2762,7 @@ def _check_group_alignment_tfvars(group_lines: List[Tuple[int, str]], indent_lev
         # Check if this is an array/object declaration line (e.g., "param = [" or "param = {")
         # For top-level declarations (indent=0), we should check alignment
         # For nested declarations, we should skip them from expected position calculation only
-        after_equals = display_line[equals_pos + 1:].strip()
-        is_object_or_array_decl = after_equals.startswith('[') or after_equals.startswith('{')
+        is_object_or_array_decl = columns.value_first_char[actual_line_num - 1] in ('[', '{')
         
         # Skip object/array declarations from expected position calculation if they're nested
         # But still check their alignment if they're top-level
@@ -2877,14 +2772,14 @@ def _check_group_alignment_tfvars(group_lines: List[Tuple[int, str]], indent_lev
         # Match parameter name, optionally with quotes
         # For quoted params like "format", we need to handle the quotes
         # For unquoted params like type, we just need the name
-        if before_equals.strip().startswith('"') or before_equals.strip().startswith("'"):
-            param_name_match = re.match(r'^\s*(["\'])([^"\'=\s]+)\1', before_equals)
+        if before_equals.strip().startswith(('"', "'")):
+            param_name_match = _QUOTED_PARAM_NAME_RE.match(before_equals)
             if param_name_match:
                 param_name = param_name_match.group(2)
             else:
                 param_name_match = None
         else:
-            param_name_match = re.match(r'^\s*([^"\'=\s]+)', before_equals)
+            param_name_match = _BARE_PARAM_NAME_RE.match(before_equals)
             if param_name_match:
                 param_name = param_name_match.group(1)
             else:
@@ -2949,7 +2844,7 @@ def _check_group_alignment_tfvars(group_lines: List[Tuple[int, str]], indent_lev
         # considers skipped parameters and special cases
         # Check if any parameter has quotes and add quote length
         has_quoted_params = any(
-            line[:line.find('=')].strip().startswith('"') or line[:line.find('=')].strip().startswith("'")
+            line[:line.find('=')].strip().startswith(('"', "'"))
             for _, line, _, _, _ in param_data
         )
         quote_chars = 2 if has_quoted_params else 0
@@ -3055,7 +2950,7 @@ def _check_group_alignment_tfvars(group_lines: List[Tuple[int, str]], indent_lev
             longest_param_len = max(len(p[0]) for p in param_data)
     # Check if any parameter has quotes and add quote length
     has_quoted_params = any(
-        line[:line.find('=')].strip().startswith('"') or line[:line.find('=')].strip().startswith("'")
+        line[:line.find('=')].strip().startswith(('"', "'"))
         for _, line, _, _, _ in param_data
     )
     quote_chars = 2 if has_quoted_params else 0
@@ -3140,7 +3035,7 @@ def _check_group_alignment_tfvars(group_lines: List[Tuple[int, str]], indent_lev
     # For tfvars files, always align to longest parameter name
     # Check if any parameter has quotes
     has_quoted_params = any(
-        line[:line.find('=')].strip().startswith('"') or line[:line.find('=')].strip().startswith("'")
+        line[:line.find('=')].strip().startswith(('"', "'"))
         for _, line, _, _, _ in param_data
     )
     quote_chars = 2 if has_quoted_params else 0
@@ -3182,7 +3077,7 @@ def _check_group_alignment_tfvars(group_lines: List[Tuple[int, str]], indent_lev
         # For parameters with quotes, add quote characters to length
         param_display_length = len(param_name)
         before_eq_for_quote = line[: line.find('=')]
-        if before_eq_for_quote.strip().startswith('"') or before_eq_for_quote.strip().startswith("'"):
+        if before_eq_for_quote.strip().startswith(('"', "'")):
             param_display_length += 2  # Add quotes length
         
         # Check if this parameter is already aligned with at least 2 other NON-TAB parameters
@@ -3337,7 +3232,7 @@ def _is_inside_block_structure_tfvars(current_line: str, all_lines: List[str], c
         bool: True if the line is inside a block structure, False otherwise
     """
     # Check if this line is inside a block structure (including lines with =, {, or })
-    if (('=' in current_line.strip() or current_line.strip().startswith('{') or current_line.strip().startswith('}')) 
+    if (('=' in current_line.strip() or current_line.strip().startswith(('{', '}'))) 
         and not current_line.strip().startswith('#')):
         # Look backwards to see if we're inside a block structure
         brace_count = 0
@@ -3352,15 +3247,8 @@ def _is_inside_block_structure_tfvars(current_line: str, all_lines: List[str], c
                 continue
                 
             # Count braces and brackets to track block structure
-            for char in line:
-                if char == '{':
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                elif char == '[':
-                    bracket_count += 1
-                elif char == ']':
-                    bracket_count -= 1
+            brace_count += line.count('{') - line.count('}')
+            bracket_count += line.count('[') - line.count(']')
             
             # If we have unmatched opening braces/brackets, we're inside a block
             if brace_count > 0 or bracket_count > 0:
@@ -51,9 +51,10 @@ Author: Lance
 License: Apache 2.0
 """
 
-import re
 from typing import Callable, List, Tuple, Optional
 
+from ._common import HEREDOC_RE
+
 
 def check_st005_indentation_level(file_path: str, content: str, log_error_func: Callable[[str, str, str, Optional[int]], None]) -> None:
     """
@@ -372,7 +373,7 @@ def _check_heredoc_state(line: str, current_in_heredoc: bool, current_terminator
     # Terraform supports both <<TERMINATOR and <<-TERMINATOR formats
     if not current_in_heredoc:
         # Match both <<TERMINATOR and <<-TERMINATOR formats
-        heredoc_match = re.search(r'<<-?([A-Z]+)\s*$', line)
+        heredoc_match = HEREDOC_RE.search(line)
         if heredoc_match:
             return {
                 "in_heredoc": True,